@@ -2,9 +2,14 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import re
+import traceback
 from datetime import datetime
+from functools import lru_cache
 import io
 
+# Copy-on-Write: derived frames share data until written, so defensive .copy() calls aren't needed
+pd.set_option("mode.copy_on_write", True)
+
 # Configure page settings for better display
 st.set_page_config(
     page_title="Golf Tournament Data Parser",
@@ -18,6 +23,115 @@ st.write("Paste your tournament text data and we'll parse it into a structured f
 # Required columns
 REQUIRED_COLUMNS = ["Date", "Name", "Course", "Category", "Gender", "City", "State", "Zip"]
 
+# Line classification lookups for the status-based format
+STATUS_KEYWORDS = frozenset(["OPEN", "OPENS", "CLOSED", "REGISTRATION OPEN", "SOLD OUT", "INVITATION LIST"])
+ACTION_LINES = frozenset(["View", "Register", "Details"])
+# Status lines skipped after the course name in Golf Genius listings
+GOLF_GENIUS_STATUS_LINES = frozenset(["OPEN", "CLOSED", "REGISTRATION OPEN"])
+WEEKDAY_DATE_RE = re.compile(r'[A-Za-z]{3},\s+[A-Za-z]{3}\s+\d{1,2}')
+UPPER_WEEKDAY_DATE_RE = re.compile(r'^[A-Z]{3},\s+[A-Z]{3}\s+\d{1,2}$')
+TIME_ZONE_LINE_RE = re.compile(r'^\d{1,2}:\d{2}\s+[AP]M\s+[A-Z]{3,4}$')
+
+# Literal keyword lists checked with plain substring/prefix tests instead of regex alternation
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+ENTRY_STATUS_MARKERS = ("Entry Deadline:", "Entries Closed", "Entries Open:")
+
+def is_weekday_date_line(line, upper_only=False):
+    """
+    Check if a line starts with a date like "Thu, Jun 12".
+    A cheap character test rejects most lines before the regex is tried.
+    """
+    if len(line) < 8 or line[3] != ',':
+        return False
+    if upper_only:
+        return UPPER_WEEKDAY_DATE_RE.match(line) is not None
+    return WEEKDAY_DATE_RE.match(line) is not None
+
+def contains_weekday_date(line):
+    """Check if a line contains a date like "Thu, Jun 12" anywhere in it."""
+    if ',' not in line:
+        return False
+    return WEEKDAY_DATE_RE.search(line) is not None
+
+def is_time_line(line):
+    """Check if a line is a time like "5:00 PM MST"."""
+    if not line[:1].isdigit() or ':' not in line[:3]:
+        return False
+    return TIME_ZONE_LINE_RE.match(line) is not None
+
+# Month names and abbreviations mapped to two-digit month numbers (full names first)
+MONTH_NUMBERS = {
+    'January': '01', 'Jan': '01', 'February': '02', 'Feb': '02', 'March': '03', 'Mar': '03',
+    'April': '04', 'Apr': '04', 'May': '05', 'June': '06', 'Jun': '06', 'July': '07', 
+    'Jul': '07', 'August': '08', 'Aug': '08', 'September': '09', 'Sep': '09', 
+    'October': '10', 'Oct': '10', 'November': '11', 'Nov': '11', 'December': '12', 'Dec': '12'
+}
+
+# State names and common variations mapped to two-letter abbreviations
+STATE_ABBREVIATIONS = {
+    'ALABAMA': 'AL', 'ALASKA': 'AK', 'ARIZONA': 'AZ', 'ARKANSAS': 'AR',
+    'CALIFORNIA': 'CA', 'COLORADO': 'CO', 'CONNECTICUT': 'CT', 'DELAWARE': 'DE',
+    'DISTRICT OF COLUMBIA': 'DC', 'FLORIDA': 'FL', 'GEORGIA': 'GA', 'HAWAII': 'HI',
+    'IDAHO': 'ID', 'ILLINOIS': 'IL', 'INDIANA': 'IN', 'IOWA': 'IA',
+    'KANSAS': 'KS', 'KENTUCKY': 'KY', 'LOUISIANA': 'LA', 'MAINE': 'ME',
+    'MARYLAND': 'MD', 'MASSACHUSETTS': 'MA', 'MICHIGAN': 'MI', 'MINNESOTA': 'MN',
+    'MISSISSIPPI': 'MS', 'MISSOURI': 'MO', 'MONTANA': 'MT', 'NEBRASKA': 'NE',
+    'NEVADA': 'NV', 'NEW HAMPSHIRE': 'NH', 'NEW JERSEY': 'NJ', 'NEW MEXICO': 'NM',
+    'NEW YORK': 'NY', 'NORTH CAROLINA': 'NC', 'NORTH DAKOTA': 'ND', 'OHIO': 'OH',
+    'OKLAHOMA': 'OK', 'OREGON': 'OR', 'PENNSYLVANIA': 'PA', 'RHODE ISLAND': 'RI',
+    'SOUTH CAROLINA': 'SC', 'SOUTH DAKOTA': 'SD', 'TENNESSEE': 'TN', 'TEXAS': 'TX',
+    'UTAH': 'UT', 'VERMONT': 'VT', 'VIRGINIA': 'VA', 'WASHINGTON': 'WA',
+    'WEST VIRGINIA': 'WV', 'WISCONSIN': 'WI', 'WYOMING': 'WY',
+    # Common variations and abbreviations
+    'WASH': 'WA', 'PENN': 'PA', 'PENNA': 'PA', 'MASS': 'MA', 'TENN': 'TN', 
+    'CALIF': 'CA', 'COLO': 'CO', 'FLA': 'FL', 'ILL': 'IL', 'MICH': 'MI', 
+    'MINN': 'MN', 'MISS': 'MS', 'MONT': 'MT', 'OKLA': 'OK', 'ORE': 'OR', 
+    'WASH DC': 'DC', 'D.C.': 'DC', 'WASH D.C.': 'DC',
+    # British Columbia and Canadian provinces (since some tournaments are there)
+    'BRITISH COLUMBIA': 'BC', 'ALBERTA': 'AB', 'SASKATCHEWAN': 'SK',
+    'MANITOBA': 'MB', 'ONTARIO': 'ON', 'QUEBEC': 'QC', 'NEW BRUNSWICK': 'NB',
+    'NOVA SCOTIA': 'NS', 'PRINCE EDWARD ISLAND': 'PE', 'NEWFOUNDLAND': 'NL',
+    'YUKON': 'YT', 'NORTHWEST TERRITORIES': 'NT', 'NUNAVUT': 'NU'
+}
+
+# Exact-match lookup for a line that is only a month name (full or abbreviated)
+MONTH_NAME_SET = frozenset(MONTH_NUMBERS)
+
+# Golf Genius listings abbreviate months in upper case ("JAN") as well as "Jan"
+GOLF_GENIUS_MONTHS = dict(MONTH_NUMBERS)
+GOLF_GENIUS_MONTHS.update({name.upper(): num for name, num in MONTH_NUMBERS.items() if len(name) == 3})
+
+# Two-letter codes for the 50 US states plus DC
+US_STATE_CODES = frozenset([
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", 
+    "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", 
+    "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", 
+    "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", 
+    "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY", "DC"
+])
+
+# Shared date/location patterns used by several parsers
+CITY_STATE_END_RE = re.compile(r'(.*?),\s+([A-Z]{2})$')  # City, ST at the end of a location line
+MONTH_DAY_YEAR_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})')  # Month Day, Year
+MONTH_DAY_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2})')  # Month Day
+WEEKDAY_MONTH_DAY_RE = re.compile(r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})')  # Weekday, Mon Day
+MONTH_DAY_RANGE_YEAR_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2})\s*-\s*(?:[A-Za-z]+\s+)?(?:\d{1,2})?,\s*(\d{4})')  # Month Day - [Month] Day, Year
+MONTH_NAME_DAY_RE = re.compile(r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}')  # full or abbreviated month name followed by a day
+STATE_CODE_WORD_RE = re.compile(r'\b([A-Z]{2})\b')  # standalone two-letter state code
+US_STATE_NAME_RE = re.compile(r'(\b(?:Arizona|Alabama|Alaska|Arkansas|California|Colorado|Connecticut|Delaware|Florida|Georgia|Hawaii|Idaho|Illinois|Indiana|Iowa|Kansas|Kentucky|Louisiana|Maine|Maryland|Massachusetts|Michigan|Minnesota|Mississippi|Missouri|Montana|Nebraska|Nevada|New\s+Hampshire|New\s+Jersey|New\s+Mexico|New\s+York|North\s+Carolina|North\s+Dakota|Ohio|Oklahoma|Oregon|Pennsylvania|Rhode\s+Island|South\s+Carolina|South\s+Dakota|Tennessee|Texas|Utah|Vermont|Virginia|Washington|West\s+Virginia|Wisconsin|Wyoming)\b)')  # full US state name
+STATE_CODE_END_RE = re.compile(r'([A-Z]{2})$')  # two-letter state code at the end
+CITY_STATE_RE = re.compile(r'(.*?),\s+([A-Z]{2})')  # City, ST anywhere in a line
+MONTH_WORD_DAY_RE = re.compile(r'([A-Za-z]+)\s+\d{1,2}')  # Month Day, capturing only the month
+SLASH_DATE_RANGE_END_RE = re.compile(r'\d{1,2}/\d{1,2}(?:\s*-\s*(?:\d{1,2}/\d{1,2}|\d{1,2}))?$')  # M/D or M/D - M/D at the end of a line
+SLASH_DATE_RE = re.compile(r'\d{1,2}/\d{1,2}')  # M/D anywhere
+UPPER_WEEKDAY_MONTH_PREFIX_RE = re.compile(r'^[A-Z]{3},\s+[A-Z]{3}')  # THU, JUN at the start of a line
+TIME_PREFIX_RE = re.compile(r'^\d{1,2}:\d{2}\s+[AP]M')  # 5:00 PM at the start of a line
+
+# Date component patterns used by ultra_simple_date_extractor
+DAY_NUMBER_RE = re.compile(r'\d+')
+FOUR_DIGIT_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+
+@lru_cache(maxsize=4096)
 def ultra_simple_date_extractor(text, default_year="2025"):
     """
     An extremely simple date extractor that works without complex regex.
@@ -29,19 +143,11 @@ def ultra_simple_date_extractor(text, default_year="2025"):
     # Step 1: Get the part before any dash
     first_part = text.split('-')[0].strip()
     
-    # Step 2: Define all possible month names and numbers
-    month_dict = {
-        'January': '01', 'Jan': '01', 'February': '02', 'Feb': '02', 'March': '03', 'Mar': '03',
-        'April': '04', 'Apr': '04', 'May': '05', 'June': '06', 'Jun': '06', 'July': '07', 
-        'Jul': '07', 'August': '08', 'Aug': '08', 'September': '09', 'Sep': '09', 
-        'October': '10', 'Oct': '10', 'November': '11', 'Nov': '11', 'December': '12', 'Dec': '12'
-    }
-    
-    # Step 3: Find which month name is in the text
+    # Step 2: Find which month name is in the text
     found_month = None
     month_value = None
     
-    for month_name, month_num in month_dict.items():
+    for month_name, month_num in MONTH_NUMBERS.items():
         if month_name in first_part:
             found_month = month_name
             month_value = month_num
@@ -50,67 +156,27 @@ def ultra_simple_date_extractor(text, default_year="2025"):
     if not found_month:
         return None
     
-    # Step 4: Find any number after the month name
+    # Step 3: Find any number after the month name
     after_month_text = first_part.split(found_month)[1]
-    day_match = re.search(r'\d+', after_month_text)
+    day_match = DAY_NUMBER_RE.search(after_month_text)
     
     if not day_match:
         return None
     
     day = day_match.group(0).zfill(2)  # Pad with leading zero
     
-    # Step 5: Find a 4-digit year, or use default
-    year_match = re.search(r'\b(20\d{2})\b', text)
+    # Step 4: Find a 4-digit year, or use default (no "20" means no year to find)
+    year_match = FOUR_DIGIT_YEAR_RE.search(text) if "20" in text else None
     year = year_match.group(1) if year_match else default_year
     
-    # Step 6: Return formatted date
+    # Step 5: Return formatted date
     return f"{year}-{month_value}-{day}"
 
-def standardize_state(state_str):
-    """Convert state names to two-letter abbreviations, handling all 50 states plus DC."""
-    if not state_str:
-        return None
-        
-    state_str = str(state_str).strip().upper()
-    
-    # Dictionary of state names to abbreviations
-    state_dict = {
-        'ALABAMA': 'AL', 'ALASKA': 'AK', 'ARIZONA': 'AZ', 'ARKANSAS': 'AR',
-        'CALIFORNIA': 'CA', 'COLORADO': 'CO', 'CONNECTICUT': 'CT', 'DELAWARE': 'DE',
-        'DISTRICT OF COLUMBIA': 'DC', 'FLORIDA': 'FL', 'GEORGIA': 'GA', 'HAWAII': 'HI',
-        'IDAHO': 'ID', 'ILLINOIS': 'IL', 'INDIANA': 'IN', 'IOWA': 'IA',
-        'KANSAS': 'KS', 'KENTUCKY': 'KY', 'LOUISIANA': 'LA', 'MAINE': 'ME',
-        'MARYLAND': 'MD', 'MASSACHUSETTS': 'MA', 'MICHIGAN': 'MI', 'MINNESOTA': 'MN',
-        'MISSISSIPPI': 'MS', 'MISSOURI': 'MO', 'MONTANA': 'MT', 'NEBRASKA': 'NE',
-        'NEVADA': 'NV', 'NEW HAMPSHIRE': 'NH', 'NEW JERSEY': 'NJ', 'NEW MEXICO': 'NM',
-        'NEW YORK': 'NY', 'NORTH CAROLINA': 'NC', 'NORTH DAKOTA': 'ND', 'OHIO': 'OH',
-        'OKLAHOMA': 'OK', 'OREGON': 'OR', 'PENNSYLVANIA': 'PA', 'RHODE ISLAND': 'RI',
-        'SOUTH CAROLINA': 'SC', 'SOUTH DAKOTA': 'SD', 'TENNESSEE': 'TN', 'TEXAS': 'TX',
-        'UTAH': 'UT', 'VERMONT': 'VT', 'VIRGINIA': 'VA', 'WASHINGTON': 'WA',
-        'WEST VIRGINIA': 'WV', 'WISCONSIN': 'WI', 'WYOMING': 'WY',
-        # Common variations and abbreviations
-        'WASH': 'WA', 'PENN': 'PA', 'PENNA': 'PA', 'MASS': 'MA', 'TENN': 'TN', 
-        'CALIF': 'CA', 'COLO': 'CO', 'FLA': 'FL', 'ILL': 'IL', 'MICH': 'MI', 
-        'MINN': 'MN', 'MISS': 'MS', 'MONT': 'MT', 'OKLA': 'OK', 'ORE': 'OR', 
-        'WASH DC': 'DC', 'D.C.': 'DC', 'WASH D.C.': 'DC',
-        # British Columbia and Canadian provinces (since some tournaments are there)
-        'BRITISH COLUMBIA': 'BC', 'ALBERTA': 'AB', 'SASKATCHEWAN': 'SK',
-        'MANITOBA': 'MB', 'ONTARIO': 'ON', 'QUEBEC': 'QC', 'NEW BRUNSWICK': 'NB',
-        'NOVA SCOTIA': 'NS', 'PRINCE EDWARD ISLAND': 'PE', 'NEWFOUNDLAND': 'NL',
-        'YUKON': 'YT', 'NORTHWEST TERRITORIES': 'NT', 'NUNAVUT': 'NU'
-    }
-    
-    # If already a valid abbreviation
-    if len(state_str) == 2:
-        # Check if it's a valid state code
-        valid_states = set(state_dict.values())
-        if state_str in valid_states:
-            return state_str
-        return state_str  # Return as-is if not recognized but right length
-    
-    # If it's a full state name or variation
-    return state_dict.get(state_str, state_str)
+# Every women's keyword in determine_gender contains one of these stems, so a
+# single pattern gives the same answer for a whole column at once
+WOMEN_KEYWORDS_RE = re.compile(r'women|ladies|girls|empowher|female')
 
+@lru_cache(maxsize=4096)
 def determine_gender(tournament_name):
     """
     Determine gender from tournament name by looking for specific keywords.
@@ -169,6 +235,34 @@ def update_tournament_with_gender_and_type(tournament_data):
             
     return tournament_data
 
+# Category keywords checked in order; the first group found in the name wins
+CATEGORY_KEYWORDS = (
+    (("Amateur",), "Amateur"),
+    (("Senior",), "Seniors"),
+    (("Women", "Ladies"), "Women's"),
+    (("Junior", "Boys'", "Girls'"), "Junior's"),
+)
+
+def infer_category(name):
+    """
+    Determine category from tournament name using CATEGORY_KEYWORDS.
+    Returns "Men's" when no keyword matches.
+    """
+    for keywords, category in CATEGORY_KEYWORDS:
+        for keyword in keywords:
+            if keyword in name:
+                return category
+    return "Men's"
+
+# Set from detect_and_parse_tournaments' show_details argument, so parser debug
+# output always matches the cache key it was produced under
+parse_details_enabled = False
+
+def debug_write(*args, **kwargs):
+    """Write per-line parser debug output only when parsing details are enabled."""
+    if parse_details_enabled:
+        st.write(*args, **kwargs)
+
 def inspect_dataframe(df):
     """Debug function to inspect dataframe content at different stages"""
     st.write(f"DataFrame shape: {df.shape}")
@@ -176,10 +270,11 @@ def inspect_dataframe(df):
     st.write(f"DataFrame first few rows:")
     st.write(df.head())
     # Print the entire dataframe for debugging
-    with st.expander("Show full DataFrame for debugging"):
-        for i, row in df.iterrows():
-            st.write(f"Row {i}: {dict(row)}")
-        return df
+    if parse_details_enabled:
+        with st.expander("Show full DataFrame for debugging"):
+            for i, row in zip(df.index, df.to_dict('records')):
+                st.write(f"Row {i}: {row}")
+    return df
     
 def parse_status_based_format(text):
     """
@@ -198,7 +293,7 @@ def parse_status_based_format(text):
     This works for any state, not just Arizona.
     """
     # Split the text into lines and remove empty lines
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     tournaments = []
     i = 0
@@ -207,8 +302,7 @@ def parse_status_based_format(text):
         tournament_data = {col: None for col in REQUIRED_COLUMNS}
         
         # Check for status line (OPEN, OPENS, CLOSED, etc.)
-        status_keywords = ["OPEN", "OPENS", "CLOSED", "REGISTRATION OPEN", "SOLD OUT", "INVITATION LIST"]
-        if i < len(lines) and any(lines[i] == keyword for keyword in status_keywords):
+        if i < len(lines) and lines[i] in STATUS_KEYWORDS:
             status = lines[i]  # Store status but don't use it as the name
             i += 1
             
@@ -217,26 +311,26 @@ def parse_status_based_format(text):
                 i += 1
                 
             # Skip date line (usually in format DAY, MONTH DATE)
-            if i < len(lines) and re.match(r'^[A-Z]{3},\s+[A-Z]{3}\s+\d{1,2}$', lines[i]):
+            if i < len(lines) and is_weekday_date_line(lines[i], upper_only=True):
                 i += 1
                 
             # Skip time line (usually in format TIME TIMEZONE)
-            if i < len(lines) and re.match(r'^\d{1,2}:\d{2}\s+[AP]M\s+[A-Z]{3,4}$', lines[i]):
+            if i < len(lines) and is_time_line(lines[i]):
                 i += 1
                 
             # Now we should be at the tournament name
             # It should not be "View" and not look like a date
-            if i < len(lines) and lines[i] != "View" and not re.match(r'^[A-Za-z]{3},\s+[A-Za-z]{3}\s+\d{1,2}', lines[i]):
+            if i < len(lines) and lines[i] != "View" and not is_weekday_date_line(lines[i]):
                 tournament_data['Name'] = lines[i].strip()
                 i += 1
                 
                 # Skip "View" link or other action buttons
-                if i < len(lines) and (lines[i] == "View" or lines[i] == "Register" or lines[i] == "Details"):
+                if i < len(lines) and lines[i] in ACTION_LINES:
                     i += 1
                     
                 # Extract date from date range
                 date_value = None
-                if i < len(lines) and re.search(r'[A-Za-z]{3},\s+[A-Za-z]{3}\s+\d{1,2}', lines[i]):
+                if i < len(lines) and contains_weekday_date(lines[i]):
                     date_line = lines[i]
                     # Extract first date from date range
                     date_parts = date_line.split('-')[0].strip()
@@ -252,7 +346,7 @@ def parse_status_based_format(text):
                 if i < len(lines):
                     course_line = lines[i]
                     # If this line looks like a date and we don't have a date yet, use it as date
-                    if date_value is None and re.search(r'[A-Za-z]{3},\s+[A-Za-z]{3}\s+\d{1,2}', course_line):
+                    if date_value is None and contains_weekday_date(course_line):
                         date_parts = course_line.split('-')[0].strip()
                         tournament_data['Date'] = ultra_simple_date_extractor(date_parts, year)
                     else:
@@ -282,42 +376,23 @@ def parse_status_based_format(text):
                     tournament_data['State'] = default_state
                     
                 # Try to extract state from tournament name
-                state_match = re.search(r'\b([A-Z]{2})\b', name) if name else None
-                state_name_match = re.search(r'(\b(?:Arizona|Alabama|Alaska|Arkansas|California|Colorado|Connecticut|Delaware|Florida|Georgia|Hawaii|Idaho|Illinois|Indiana|Iowa|Kansas|Kentucky|Louisiana|Maine|Maryland|Massachusetts|Michigan|Minnesota|Mississippi|Missouri|Montana|Nebraska|Nevada|New\s+Hampshire|New\s+Jersey|New\s+Mexico|New\s+York|North\s+Carolina|North\s+Dakota|Ohio|Oklahoma|Oregon|Pennsylvania|Rhode\s+Island|South\s+Carolina|South\s+Dakota|Tennessee|Texas|Utah|Vermont|Virginia|Washington|West\s+Virginia|Wisconsin|Wyoming)\b)', name) if name else None
+                state_match = STATE_CODE_WORD_RE.search(name) if name else None
+                state_name_match = US_STATE_NAME_RE.search(name) if name else None
                 
                 if state_match:
                     potential_state = state_match.group(1)
                     # Verify it's a valid state code
-                    valid_states = ["AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", 
-                                   "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", 
-                                   "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", 
-                                   "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", 
-                                   "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY", "DC"]
-                    if potential_state in valid_states:
+                    if potential_state in US_STATE_CODES:
                         tournament_data['State'] = potential_state
                 elif state_name_match:
                     # Convert state name to code
                     state_name = state_name_match.group(1)
-                    state_dict = {
-                        'ALABAMA': 'AL', 'ALASKA': 'AK', 'ARIZONA': 'AZ', 'ARKANSAS': 'AR',
-                        'CALIFORNIA': 'CA', 'COLORADO': 'CO', 'CONNECTICUT': 'CT', 'DELAWARE': 'DE',
-                        'FLORIDA': 'FL', 'GEORGIA': 'GA', 'HAWAII': 'HI', 'IDAHO': 'ID',
-                        'ILLINOIS': 'IL', 'INDIANA': 'IN', 'IOWA': 'IA', 'KANSAS': 'KS',
-                        'KENTUCKY': 'KY', 'LOUISIANA': 'LA', 'MAINE': 'ME', 'MARYLAND': 'MD',
-                        'MASSACHUSETTS': 'MA', 'MICHIGAN': 'MI', 'MINNESOTA': 'MN', 'MISSISSIPPI': 'MS',
-                        'MISSOURI': 'MO', 'MONTANA': 'MT', 'NEBRASKA': 'NE', 'NEVADA': 'NV',
-                        'NEW HAMPSHIRE': 'NH', 'NEW JERSEY': 'NJ', 'NEW MEXICO': 'NM', 'NEW YORK': 'NY',
-                        'NORTH CAROLINA': 'NC', 'NORTH DAKOTA': 'ND', 'OHIO': 'OH', 'OKLAHOMA': 'OK',
-                        'OREGON': 'OR', 'PENNSYLVANIA': 'PA', 'RHODE ISLAND': 'RI', 'SOUTH CAROLINA': 'SC',
-                        'SOUTH DAKOTA': 'SD', 'TENNESSEE': 'TN', 'TEXAS': 'TX', 'UTAH': 'UT',
-                        'VERMONT': 'VT', 'VIRGINIA': 'VA', 'WASHINGTON': 'WA', 'WEST VIRGINIA': 'WV',
-                        'WISCONSIN': 'WI', 'WYOMING': 'WY', 'DISTRICT OF COLUMBIA': 'DC'
-                    }
-                    tournament_data['State'] = state_dict.get(state_name.upper(), None)
+                    tournament_data['State'] = STATE_ABBREVIATIONS.get(state_name.upper(), None)
                 
                 # Add tournament to the list if it has at least a name
+                # (values are stored as a row tuple in REQUIRED_COLUMNS order)
                 if tournament_data['Name']:
-                    tournaments.append(tournament_data)
+                    tournaments.append(tuple(tournament_data[col] for col in REQUIRED_COLUMNS))
             else:
                 # If we don't find what we expect, move to next line
                 i += 1
@@ -325,20 +400,16 @@ def parse_status_based_format(text):
             # Move to next line if not at a status line
             i += 1
     
-    # Convert to DataFrame
+    # Convert to DataFrame (rows already hold every required column in order)
     if tournaments:
-        tournaments_df = pd.DataFrame(tournaments)
-        
-        # Ensure all required columns exist
-        for col in REQUIRED_COLUMNS:
-            if col not in tournaments_df.columns:
-                tournaments_df[col] = None
-                
-        return tournaments_df
+        return pd.DataFrame(tournaments, columns=REQUIRED_COLUMNS)
     else:
         # Return empty DataFrame with all required columns
         return pd.DataFrame(columns=REQUIRED_COLUMNS)
     
+# Per-line patterns used by parse_gam_championship_format
+COMMA_STATE_CODE_END_RE = re.compile(r',\s+([A-Z]{2})$')
+
 def parse_gam_championship_format(text):
     """
     Parse format with tournament details in a structured format, 
@@ -351,21 +422,26 @@ def parse_gam_championship_format(text):
     Age Group: Junior
     Gender: Female
     """
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     tournaments = []
     i = 0
     
+    # Look for line with tournament name and date together
+    # Pattern: Name followed by month abbreviation and day
+    month_names = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", 
+                   "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+    
+    date_pattern = '|'.join(month_names)
+    name_date_regex = re.compile(f'(.*?)({date_pattern}\\s+\\d{{1,2}},?\\s+\\d{{4}}.*)')
+    
     while i < len(lines):
-        # Look for line with tournament name and date together
-        # Pattern: Name followed by month abbreviation and day
-        month_names = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", 
-                       "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-        
-        date_pattern = '|'.join(month_names)
-        name_date_pattern = f'(.*?)({date_pattern}\\s+\\d{{1,2}},?\\s+\\d{{4}}.*)'
-        
-        name_date_match = re.search(name_date_pattern, lines[i])
+        # Only lines that mention a month abbreviation can match, so skip the regex otherwise
+        line = lines[i]
+        if any(month in line for month in month_names):
+            name_date_match = name_date_regex.search(line)
+        else:
+            name_date_match = None
         
         if name_date_match:
             # Extract tournament name and date from combined line
@@ -483,7 +559,7 @@ def parse_gam_championship_format(text):
             state = ""
             # Try to extract state code from city
             if city:
-                state_match = re.search(r',\s+([A-Z]{2})$', city)
+                state_match = COMMA_STATE_CODE_END_RE.search(city)
                 if state_match:
                     state = state_match.group(1)
                     city = city[:state_match.start()].strip()
@@ -524,12 +600,18 @@ def parse_gam_championship_format(text):
         for col in REQUIRED_COLUMNS:
             if col not in tournaments_df.columns:
                 tournaments_df[col] = None
-                
+
         return tournaments_df
     else:
         # Return empty DataFrame with all required columns
         return pd.DataFrame(columns=REQUIRED_COLUMNS)
 
+# Per-line patterns used by parse_usga_qualifier_format
+WEEKDAY_COMMA_PREFIX_RE = re.compile(r'^(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),')
+USGA_QUALIFIER_DATE_RE = re.compile(r'^(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),?\s+(\d{4})$')
+USGA_QUALIFIER_RANGE_RE = re.compile(r'^(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})\s+-\s+(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s+(\d{4})$')
+USGA_QUALIFIER_SIMPLE_RANGE_RE = re.compile(r'^(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})\s+-\s+(?:Sun|Mon|Tue|Wed|Thu|Fri|Sat),\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+(\d{4})$')
+
 def parse_usga_qualifier_format(text):
     """
     Parse USGA qualifier format with tournament name, View, date, and course.
@@ -540,21 +622,15 @@ def parse_usga_qualifier_format(text):
     Thu, Jun 12, 2025
     Oak Glen Golf Course
     """
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     tournaments = []
     i = 0
     
-    # Month dictionary for date conversion
-    month_dict = {
-        'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04', 'May': '05', 'Jun': '06',
-        'Jul': '07', 'Aug': '08', 'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-    }
-    
     # Process lines in blocks of 4
     while i + 3 < len(lines):  # Need at least 4 lines for a complete entry
         # Check if this pattern matches the expected format
-        if lines[i+1] == "View" and re.search(r'^(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),', lines[i+2]):
+        if lines[i+1] == "View" and WEEKDAY_COMMA_PREFIX_RE.search(lines[i+2]):
             # Extract information
             tournament_name = lines[i]
             date_line = lines[i+2]
@@ -562,23 +638,23 @@ def parse_usga_qualifier_format(text):
             
             # Process date line (Thu, Jun 12, 2025 -> Jun 12, 2025)
             date_value = None
-            date_match = re.search(r'^(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),?\s+(\d{4})$', date_line)
+            date_match = USGA_QUALIFIER_DATE_RE.search(date_line)
             
             if date_match:
                 month, day, yr = date_match.groups()
-                date_value = f"{yr}-{month_dict[month]}-{day.zfill(2)}"
+                date_value = f"{yr}-{MONTH_NUMBERS[month]}-{day.zfill(2)}"
             else:
                 # Try another date pattern for date ranges
-                range_match = re.search(r'^(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})\s+-\s+(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s+(\d{4})$', date_line)
+                range_match = USGA_QUALIFIER_RANGE_RE.search(date_line)
                 if range_match:
                     month, day, yr = range_match.groups()
-                    date_value = f"{yr}-{month_dict[month]}-{day.zfill(2)}"
+                    date_value = f"{yr}-{MONTH_NUMBERS[month]}-{day.zfill(2)}"
                 else:
                     # Try a simpler pattern for date ranges
-                    simple_match = re.search(r'^(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})\s+-\s+(?:Sun|Mon|Tue|Wed|Thu|Fri|Sat),\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+(\d{4})$', date_line)
+                    simple_match = USGA_QUALIFIER_SIMPLE_RANGE_RE.search(date_line)
                     if simple_match:
                         month, day, yr = simple_match.groups()
-                        date_value = f"{yr}-{month_dict[month]}-{day.zfill(2)}"
+                        date_value = f"{yr}-{MONTH_NUMBERS[month]}-{day.zfill(2)}"
                     else:
                         # Last fallback - use ultra_simple_date_extractor
                         date_value = ultra_simple_date_extractor(date_line, year)
@@ -640,12 +716,15 @@ def parse_usga_qualifier_format(text):
         for col in REQUIRED_COLUMNS:
             if col not in tournaments_df.columns:
                 tournaments_df[col] = None
-                
+
         return tournaments_df
     else:
         # Return empty DataFrame with all required columns
         return pd.DataFrame(columns=REQUIRED_COLUMNS)
     
+# Per-line patterns used by parse_usga_view_format
+USGA_VIEW_DATE_RE = re.compile(r'^(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),\s+(\d{4})$')
+
 def parse_usga_view_format(text):
     """
     Special parser for USGA format with tournament, View, date, course pattern.
@@ -656,17 +735,11 @@ def parse_usga_view_format(text):
     Thu, Jun 12, 2025
     Oak Glen Golf Course
     """
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     tournaments = []
     i = 0
     
-    # Month dictionary for date conversion
-    month_dict = {
-        'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04', 'May': '05', 'Jun': '06',
-        'Jul': '07', 'Aug': '08', 'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-    }
-    
     # Process lines in groups of 4
     while i <= len(lines) - 4:  # Need at least 4 lines
         tournament_name = lines[i]
@@ -677,11 +750,11 @@ def parse_usga_view_format(text):
         # Check if this is a USGA tournament entry (second line is "View")
         if view_line == "View":
             # Extract date components from date line
-            date_match = re.search(r'^(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),\s+(\d{4})$', date_line)
+            date_match = USGA_VIEW_DATE_RE.search(date_line)
             
             if date_match:
                 month, day, yr = date_match.groups()
-                date_value = f"{yr}-{month_dict[month]}-{day.zfill(2)}"
+                date_value = f"{yr}-{MONTH_NUMBERS[month]}-{day.zfill(2)}"
                 
                 # Determine category based on tournament name
                 category = "Amateur"
@@ -731,12 +804,19 @@ def parse_usga_view_format(text):
         for col in REQUIRED_COLUMNS:
             if col not in tournaments_df.columns:
                 tournaments_df[col] = None
-        
+
         return tournaments_df
     else:
         # Return empty DataFrame with all required columns
         return pd.DataFrame(columns=REQUIRED_COLUMNS)
     
+# Per-line patterns used by parse_amateur_golf_format_improved
+TRAILING_STATE_CODE_RE = re.compile(r',\s+[A-Z]{2}$')
+MONTH_DAY_YEAR_TEXT_RE = re.compile(r'[A-Za-z]+\s+\d{1,2},\s+\d{4}')
+AMATEUR_DATE_RANGE_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2})(?:\s*-\s*\d{1,2})?,\s+(\d{4})')
+AMATEUR_DAY_RANGE_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2})\s*-\s*\d+,\s*(\d{4})')
+YEAR_PREFIX_RE = re.compile(r'^\d{4}\s+')
+
 def parse_amateur_golf_format_improved(text, default_year="2025", default_state=None):
     """
     Improved parser for amateur golf tournaments that can handle multiple formats:
@@ -779,23 +859,7 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
     import pandas as pd
     
     # Process text into lines
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    
-    # Month mapping
-    month_map = {
-        'Jan': '01', 'January': '01',
-        'Feb': '02', 'February': '02',
-        'Mar': '03', 'March': '03',
-        'Apr': '04', 'April': '04',
-        'May': '05',
-        'Jun': '06', 'June': '06',
-        'Jul': '07', 'July': '07',
-        'Aug': '08', 'August': '08',
-        'Sep': '09', 'Sept': '09', 'September': '09',
-        'Oct': '10', 'October': '10',
-        'Nov': '11', 'November': '11',
-        'Dec': '12', 'December': '12'
-    }
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     tournaments = []
     
@@ -816,14 +880,14 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
             # Check if lines 1 and 3 are the same (repeated course name)
             if lines[start_idx] == lines[start_idx + 2]:
                 # Check if line 4 has city, state format
-                if re.search(r',\s+[A-Z]{2}$', lines[start_idx + 3]):
+                if TRAILING_STATE_CODE_RE.search(lines[start_idx + 3]):
                     # Check if line 5 has a date
-                    if re.search(r'[A-Za-z]+\s+\d{1,2},\s+\d{4}', lines[start_idx + 4]):
+                    if MONTH_DAY_YEAR_TEXT_RE.search(lines[start_idx + 4]):
                         matches += 1
         
         if matches > 0:
             is_repeated_course_format = True
-            st.write(f"Detected exact 5-line format with {matches} matches out of {sample_blocks} samples")
+            debug_write(f"Detected exact 5-line format with {matches} matches out of {sample_blocks} samples")
     
     # If confirmed as repeated course format, process it
     if is_repeated_course_format:
@@ -837,12 +901,12 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                 break
             
             # Print the actual lines for debugging
-            st.write(f"DEBUG - Block {i+1} lines:")
-            st.write(f"  Line 1 (Course): '{lines[start_idx]}'") 
-            st.write(f"  Line 2 (Name): '{lines[start_idx+1]}'")
-            st.write(f"  Line 3 (Course repeat): '{lines[start_idx+2]}'")
-            st.write(f"  Line 4 (Location): '{lines[start_idx+3]}'")
-            st.write(f"  Line 5 (Date): '{lines[start_idx+4]}'")
+            debug_write(f"DEBUG - Block {i+1} lines:")
+            debug_write(f"  Line 1 (Course): '{lines[start_idx]}'") 
+            debug_write(f"  Line 2 (Name): '{lines[start_idx+1]}'")
+            debug_write(f"  Line 3 (Course repeat): '{lines[start_idx+2]}'")
+            debug_write(f"  Line 4 (Location): '{lines[start_idx+3]}'")
+            debug_write(f"  Line 5 (Date): '{lines[start_idx+4]}'")
                 
             # In the 5-line format from the example:
             # Line 1: Course Name
@@ -861,7 +925,7 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
             state = default_state
             city = None
             
-            location_match = re.search(r'(.*?),\s+([A-Z]{2})$', location)
+            location_match = CITY_STATE_END_RE.search(location)
             if location_match:
                 city = location_match.group(1).strip()
                 state = location_match.group(2).strip()
@@ -870,8 +934,8 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
             date_value = None
             
             # Format: Month DD, YYYY - Month DD, YYYY
-            date_match = re.search(r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})', date_text)
-            date_range_match = re.search(r'([A-Za-z]+)\s+(\d{1,2})\s*-\s*(?:[A-Za-z]+\s+)?(?:\d{1,2})?,\s*(\d{4})', date_text)
+            date_match = MONTH_DAY_YEAR_RE.search(date_text)
+            date_range_match = MONTH_DAY_RANGE_YEAR_RE.search(date_text)
             
             if date_match:
                 month_name = date_match.group(1)
@@ -879,7 +943,7 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                 year = date_match.group(3)
                 
                 # Get month number
-                month = month_map.get(month_name[:3], '01')
+                month = MONTH_NUMBERS.get(month_name[:3], '01')
                 
                 # Format date
                 date_value = f"{year}-{month}-{day.zfill(2)}"
@@ -889,19 +953,19 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                 year = date_range_match.group(3)
                 
                 # Get month number
-                month = month_map.get(month_name[:3], '01')
+                month = MONTH_NUMBERS.get(month_name[:3], '01')
                 
                 # Format date
                 date_value = f"{year}-{month}-{day.zfill(2)}"
             else:
                 # Try other date patterns
-                simple_date_match = re.search(r'([A-Za-z]+)\s+(\d{1,2})', date_text)
+                simple_date_match = MONTH_DAY_RE.search(date_text)
                 if simple_date_match:
                     month_name = simple_date_match.group(1)
                     day = simple_date_match.group(2)
                     
                     # Get month number
-                    month = month_map.get(month_name[:3], '01')
+                    month = MONTH_NUMBERS.get(month_name[:3], '01')
                     
                     # Use default year
                     date_value = f"{default_year}-{month}-{day.zfill(2)}"
@@ -966,12 +1030,12 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                 }
                 
                 # Explicitly show what is being added to help debug
-                st.write(f"Adding tournament: Name='{name}' Course='{course}'")
+                debug_write(f"Adding tournament: Name='{name}' Course='{course}'")
                 
                 tournaments.append(tournament)
             else:
                 # No valid date found
-                st.write(f"Skipping block {i+1} - no valid date found in: '{date_text}'")
+                debug_write(f"Skipping block {i+1} - no valid date found in: '{date_text}'")
     
     # If not the repeated course format or no tournaments found, try other formats
     if not is_repeated_course_format or not tournaments:
@@ -985,13 +1049,13 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
             course_first_count = 0
             for i in range(0, len(lines), 4):
                 if (i+3 < len(lines) and 
-                    re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}', lines[i+3]) and
-                    re.search(r'(.*?),\s+([A-Z]{2})$', lines[i+2])):
+                    MONTH_NAME_DAY_RE.search(lines[i+3]) and
+                    CITY_STATE_END_RE.search(lines[i+2])):
                     course_first_count += 1
             
             if course_first_count >= len(lines) // 8:  # At least 1/2 of potential blocks match
                 format_type = "4-line-course-first"
-                st.write(f"Detected 4-line course-first format with {course_first_count} matches")
+                debug_write(f"Detected 4-line course-first format with {course_first_count} matches")
         
         # Check if this is standard 4-line format
         # In this format, every 4th line (i+3) is a date, 1st line is tournament name, 3rd line has location
@@ -1000,13 +1064,13 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
             standard_4line_count = 0
             for i in range(0, len(lines), 4):
                 if (i+3 < len(lines) and i+2 < len(lines) and
-                    re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}', lines[i+3]) and
-                    re.search(r'(.*?),\s+([A-Z]{2})$', lines[i+2])):
+                    MONTH_NAME_DAY_RE.search(lines[i+3]) and
+                    CITY_STATE_END_RE.search(lines[i+2])):
                     standard_4line_count += 1
             
             if standard_4line_count >= len(lines) // 8:  # At least 1/2 of potential blocks match
                 format_type = "4-line"
-                st.write(f"Detected standard 4-line format with {standard_4line_count} matches")
+                debug_write(f"Detected standard 4-line format with {standard_4line_count} matches")
         
         # Check if this is 3-line format
         # In this format, every 3rd line (i+2) is a date
@@ -1015,21 +1079,21 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
             three_line_count = 0
             for i in range(0, len(lines), 3):
                 if (i+2 < len(lines) and
-                    re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}', lines[i+2])):
+                    MONTH_NAME_DAY_RE.search(lines[i+2])):
                     three_line_count += 1
             
             if three_line_count >= len(lines) // 6:  # At least 1/2 of potential blocks match
                 format_type = "3-line"
-                st.write(f"Detected 3-line format with {three_line_count} matches")
+                debug_write(f"Detected 3-line format with {three_line_count} matches")
         
         # If no specific format detected, choose based on line count
         if not format_type:
             if len(lines) % 3 == 0:
                 format_type = "3-line"
-                st.write("Defaulting to 3-line format based on line count")
+                debug_write("Defaulting to 3-line format based on line count")
             elif len(lines) % 4 == 0:
                 format_type = "4-line"
-                st.write("Defaulting to 4-line format based on line count")
+                debug_write("Defaulting to 4-line format based on line count")
             else:
                 # Choose the format with the least remainder
                 remainders = {
@@ -1040,7 +1104,7 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                 for fmt, rem in remainders.items():
                     if rem == min_remainder:
                         format_type = fmt
-                        st.write(f"Defaulting to {fmt} format based on minimal remainder")
+                        debug_write(f"Defaulting to {fmt} format based on minimal remainder")
                         break
         
         # Process according to detected format
@@ -1054,7 +1118,7 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                 date_range = lines[i+3]
                 
                 # Extract city and state from location
-                location_match = re.search(r'(.*?),\s+([A-Z]{2})$', location)
+                location_match = CITY_STATE_END_RE.search(location)
                 city = None
                 state = default_state
                 
@@ -1063,14 +1127,14 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                     state = location_match.group(2).strip()
                     
                 # Extract date from date range
-                date_match = re.search(r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})', date_range)
+                date_match = MONTH_DAY_YEAR_RE.search(date_range)
                 if date_match:
                     month_name = date_match.group(1)
                     day = date_match.group(2)
                     year = date_match.group(3)
                     
                     # Get month number
-                    month = month_map.get(month_name[:3], '01')
+                    month = MONTH_NUMBERS.get(month_name[:3], '01')
                     
                     # Format date
                     date_value = f"{year}-{month}-{day.zfill(2)}"
@@ -1139,7 +1203,7 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                     tournaments.append(tournament)
                     # Only print for the first few tournaments to avoid flooding the output
                     if len(tournaments) <= 10 or len(tournaments) % 10 == 0:
-                        st.write(f"✓ Added tournament #{len(tournaments)} (4-line-course-first): {tournament_name}")
+                        debug_write(f"✓ Added tournament #{len(tournaments)} (4-line-course-first): {tournament_name}")
                 
                 # Move to next block of 4 lines
                 i += 4
@@ -1154,7 +1218,7 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                 date_range = lines[i+3]
                 
                 # Extract city and state from location
-                location_match = re.search(r'(.*?),\s+([A-Z]{2})$', location)
+                location_match = CITY_STATE_END_RE.search(location)
                 city = None
                 state = default_state
                 
@@ -1163,14 +1227,14 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                     state = location_match.group(2).strip()
                     
                 # Extract date from date range
-                date_match = re.search(r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})', date_range)
+                date_match = MONTH_DAY_YEAR_RE.search(date_range)
                 if date_match:
                     month_name = date_match.group(1)
                     day = date_match.group(2)
                     year = date_match.group(3)
                     
                     # Get month number
-                    month = month_map.get(month_name[:3], '01')
+                    month = MONTH_NUMBERS.get(month_name[:3], '01')
                     
                     # Format date
                     date_value = f"{year}-{month}-{day.zfill(2)}"
@@ -1239,7 +1303,7 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                     tournaments.append(tournament)
                     # Only print for the first few tournaments to avoid flooding the output
                     if len(tournaments) <= 10 or len(tournaments) % 10 == 0:
-                        st.write(f"✓ Added tournament #{len(tournaments)} (4-line): {tournament_name}")
+                        debug_write(f"✓ Added tournament #{len(tournaments)} (4-line): {tournament_name}")
             
                 # Move to next block of 4 lines
                 i += 4
@@ -1253,9 +1317,9 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                 date_range = lines[i+2]
                 
                 # Extract date from date range
-                date_match = re.search(r'([A-Za-z]+)\s+(\d{1,2})(?:\s*-\s*\d{1,2})?,\s+(\d{4})', date_range)
-                date_match2 = re.search(r'([A-Za-z]+)\s+(\d{1,2})\s*-\s*\d+,\s*(\d{4})', date_range)
-                date_match3 = re.search(r'([A-Za-z]+)\s+(\d{1,2})', date_range)
+                date_match = AMATEUR_DATE_RANGE_RE.search(date_range)
+                date_match2 = AMATEUR_DAY_RANGE_RE.search(date_range)
+                date_match3 = MONTH_DAY_RE.search(date_range)
                 
                 date_value = None
                 
@@ -1265,7 +1329,7 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                     year = date_match.group(3)
                     
                     # Get month number
-                    month = month_map.get(month_name[:3], '01')
+                    month = MONTH_NUMBERS.get(month_name[:3], '01')
                     
                     # Format date
                     date_value = f"{year}-{month}-{day.zfill(2)}"
@@ -1275,7 +1339,7 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                     year = date_match2.group(3)
                     
                     # Get month number
-                    month = month_map.get(month_name[:3], '01')
+                    month = MONTH_NUMBERS.get(month_name[:3], '01')
                     
                     # Format date
                     date_value = f"{year}-{month}-{day.zfill(2)}"
@@ -1284,7 +1348,7 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                     day = date_match3.group(2)
                     
                     # Get month number
-                    month = month_map.get(month_name[:3], '01')
+                    month = MONTH_NUMBERS.get(month_name[:3], '01')
                     
                     # Use default year if not specified
                     date_value = f"{default_year}-{month}-{day.zfill(2)}"
@@ -1296,7 +1360,7 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                     gender = "Men's"    # Default
                     
                     # Extract year prefix if present (e.g., "2025 NYS Women's Amateur")
-                    year_prefix_match = re.match(r'^\d{4}\s+', tournament_name)
+                    year_prefix_match = YEAR_PREFIX_RE.match(tournament_name)
                     clean_name = tournament_name
                     if year_prefix_match:
                         clean_name = tournament_name[year_prefix_match.end():].strip()
@@ -1351,7 +1415,7 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                     tournaments.append(tournament)
                     # Only print for the first few tournaments to avoid flooding the output
                     if len(tournaments) <= 10 or len(tournaments) % 10 == 0:
-                        st.write(f"✓ Added tournament #{len(tournaments)} (3-line): {clean_name}")
+                        debug_write(f"✓ Added tournament #{len(tournaments)} (3-line): {clean_name}")
                 
                 # Move to next block of 3 lines
                 i += 3
@@ -1364,7 +1428,7 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
         # Check for potential column swaps
         # Define keywords typical for courses and tournaments
         if len(df) > 0:
-            st.write("Checking for potential column swap issues...")
+            debug_write("Checking for potential column swap issues...")
             # Get first few rows for analysis
             first_few_names = df['Name'].head(5).tolist()
             first_few_courses = df['Course'].head(5).tolist()
@@ -1385,38 +1449,33 @@ def parse_amateur_golf_format_improved(text, default_year="2025", default_state=
                 if course and any(kw in str(course) for kw in tournament_keywords):
                     courses_with_tournament_keywords += 1
             
-            st.write(f"Names with course keywords: {names_with_course_keywords}")
-            st.write(f"Courses with tournament keywords: {courses_with_tournament_keywords}")
+            debug_write(f"Names with course keywords: {names_with_course_keywords}")
+            debug_write(f"Courses with tournament keywords: {courses_with_tournament_keywords}")
             
             # If we have evidence the columns might be swapped
             if names_with_course_keywords > 0 and courses_with_tournament_keywords > 0:
-                st.write("WARNING: Name and Course columns may be swapped! Attempting to fix...")
-                # Swap columns
-                temp_name = df['Name'].copy()
-                df['Name'] = df['Course']
-                df['Course'] = temp_name
+                debug_write("WARNING: Name and Course columns may be swapped! Attempting to fix...")
+                # Swap columns by relabelling them instead of copying the data
+                df = df.rename(columns={'Name': 'Course', 'Course': 'Name'}, copy=False)
                 
                 # Log the swap for debugging
-                st.write("After swap - Sample entries:")
+                debug_write("After swap - Sample entries:")
                 for i in range(min(3, len(df))):
-                    st.write(f"Row {i+1}: Name='{df.iloc[i]['Name']}', Course='{df.iloc[i]['Course']}'")
+                    debug_write(f"Row {i+1}: Name='{df.iloc[i]['Name']}', Course='{df.iloc[i]['Course']}'")
             
             # Ensure specific column order
             columns = ["Date", "Name", "Course", "Category", "Gender", "City", "State", "Zip"]
-            df_ordered = pd.DataFrame(columns=columns)
             
-            # Explicitly copy each column to ensure correct order
+            # Add any missing columns in place, then select once in the defined order
             for col in columns:
-                if col in df.columns:
-                    df_ordered[col] = df[col]
-                else:
-                    df_ordered[col] = None
+                if col not in df.columns:
+                    df[col] = None
             
             # Return DataFrame with defined column order
-            return df_ordered
+            return df[columns]
         else:
             # Return empty DataFrame with required columns
-            st.write("Amateur Golf parser: No tournaments found")
+            debug_write("Amateur Golf parser: No tournaments found")
             return pd.DataFrame(columns=["Date", "Name", "Course", "Category", "Gender", "City", "State", "Zip"])
 
 def parse_robust_nnga_tournaments(text, year="2025", default_state=None):
@@ -1426,16 +1485,10 @@ def parse_robust_nnga_tournaments(text, year="2025", default_state=None):
     """
     # Process text into lines
     text = text.replace('\r\n', '\n').replace('\r', '\n')
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     tournaments = []
     
-    # Month dictionary for date conversion
-    month_dict = {
-        'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04', 'May': '05', 'Jun': '06',
-        'Jul': '07', 'Aug': '08', 'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-    }
-    
     # Find all tournament entries by looking for "View" lines
     for i in range(len(lines) - 1):
         # Check if this is a "View" line
@@ -1465,16 +1518,16 @@ def parse_robust_nnga_tournaments(text, year="2025", default_state=None):
                     if "-" in date_line:
                         first_date_part = date_line.split("-")[0].strip()
                         # Extract month and day
-                        date_match = re.search(r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})', first_date_part)
+                        date_match = WEEKDAY_MONTH_DAY_RE.search(first_date_part)
                         if date_match:
                             month, day = date_match.groups()
-                            date_value = f"{year}-{month_dict[month]}-{day.zfill(2)}"
+                            date_value = f"{year}-{MONTH_NUMBERS[month]}-{day.zfill(2)}"
                     else:
                         # Handle single date
-                        date_match = re.search(r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})', date_line)
+                        date_match = WEEKDAY_MONTH_DAY_RE.search(date_line)
                         if date_match:
                             month, day = date_match.groups()
-                            date_value = f"{year}-{month_dict[month]}-{day.zfill(2)}"
+                            date_value = f"{year}-{MONTH_NUMBERS[month]}-{day.zfill(2)}"
                     
                     # If we have all necessary pieces, create a tournament entry
                     if date_value and course_line:
@@ -1558,7 +1611,7 @@ def parse_four_line_format(text):
             # Make sure we have actual content in each line
             if tournament_name and course_name and location and date_line:
                 # Parse location for city and state
-                location_match = re.search(r'(.*?),\s+([A-Z]{2})', location)
+                location_match = CITY_STATE_RE.search(location)
                 city = ""
                 state = ""
                 if location_match:
@@ -1619,12 +1672,15 @@ def parse_four_line_format(text):
         for col in REQUIRED_COLUMNS:
             if col not in tournaments_df.columns:
                 tournaments_df[col] = None
-                
+
         return tournaments_df
     else:
         # Return empty DataFrame with all required columns
         return pd.DataFrame(columns=REQUIRED_COLUMNS)
     
+# Per-line patterns used by parse_championship_table_format
+TABLE_SLASH_DATE_END_RE = re.compile(r'(\d{1,2}/\d{1,2})(?:\s*-\s*(?:\d{1,2}/\d{1,2}|\d{1,2}))?$')
+
 def parse_championship_table_format(text):
     """
     Parse format with championships listed in a table-like structure with:
@@ -1635,7 +1691,7 @@ def parse_championship_table_format(text):
     CHAMPIONSHIPS SITE DATES
     Foursomes Wood Ranch GC 3/3 - 3/4
     """
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     tournaments = []
     
@@ -1665,7 +1721,7 @@ def parse_championship_table_format(text):
             continue
         
         # Check if this line has a date pattern
-        date_match = re.search(r'(\d{1,2}/\d{1,2})(?:\s*-\s*(?:\d{1,2}/\d{1,2}|\d{1,2}))?$', line)
+        date_match = TABLE_SLASH_DATE_END_RE.search(line)
         
         if date_match:
             # This is a line with a tournament entry
@@ -1725,7 +1781,7 @@ def parse_championship_table_format(text):
             # If course name is very short or empty, check next line for continuation
             if len(course_name.split()) <= 1 and i < len(lines):
                 next_line = lines[i]
-                if not re.search(r'\d{1,2}/\d{1,2}', next_line) and len(next_line) > 3:
+                if not SLASH_DATE_RE.search(next_line) and len(next_line) > 3:
                     # Next line looks like a continuation
                     course_name += " " + next_line
                     i += 1  # Skip this line in next iteration
@@ -1796,12 +1852,23 @@ def parse_championship_table_format(text):
         for col in REQUIRED_COLUMNS:
             if col not in tournaments_df.columns:
                 tournaments_df[col] = None
-                
+
         return tournaments_df
     else:
         # Return empty DataFrame with all required columns
         return pd.DataFrame(columns=REQUIRED_COLUMNS)
     
+# Per-line patterns used by parse_entries_close_format
+_ENTRIES_CLOSE_DATE_PATTERNS = [
+    r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}\s+-\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}$',
+    r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}-\d{1,2}$',
+    r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}(?:-|\s+-\s+)(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)?\s*\d{1,2}$',
+    r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}$',
+    r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}-\d{1,2}$',
+]
+# Combined pattern for all date formats
+ENTRIES_CLOSE_DATE_RE = re.compile('(' + '|'.join(_ENTRIES_CLOSE_DATE_PATTERNS) + ')')
+
 def parse_entries_close_format(text):
     """
     Parse format with date range, 'Entries Close' line, tournament name, and location.
@@ -1812,23 +1879,14 @@ def parse_entries_close_format(text):
     Country Club of Ocala - Ocala, FL
     Tee Times & Info
     """
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     tournaments = []
     i = 0
     
     while i < len(lines):
         # Look for a date range pattern at the start of a line
-        date_range_pattern = r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}\s+-\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}$'
-        date_range_pattern2 = r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}-\d{1,2}$'
-        date_range_pattern3 = r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}(?:-|\s+-\s+)(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)?\s*\d{1,2}$'
-        date_single_pattern = r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}$'
-        date_multiday_pattern = r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}-\d{1,2}$'
-        
-        # Combined pattern for all date formats
-        date_pattern = f"({date_range_pattern}|{date_range_pattern2}|{date_range_pattern3}|{date_single_pattern}|{date_multiday_pattern})"
-        
-        date_match = re.match(date_pattern, lines[i])
+        date_match = ENTRIES_CLOSE_DATE_RE.match(lines[i])
         
         if date_match:
             date_text = lines[i]
@@ -1874,13 +1932,13 @@ def parse_entries_close_format(text):
                         location = parts[1].strip()
                         
                         # Extract city and state from location
-                        location_match = re.search(r'(.*?),\s+([A-Z]{2})$', location)
+                        location_match = CITY_STATE_END_RE.search(location)
                         if location_match:
                             city = location_match.group(1).strip()
                             state = location_match.group(2).strip()
                 else:
                     # No clear separator, try to find city and state pattern
-                    location_match = re.search(r'(.*?),\s+([A-Z]{2})$', course_location)
+                    location_match = CITY_STATE_END_RE.search(course_location)
                     if location_match:
                         # Extract backwards from state
                         city = location_match.group(1).strip()
@@ -1966,19 +2024,23 @@ def parse_entries_close_format(text):
         for col in REQUIRED_COLUMNS:
             if col not in tournaments_df.columns:
                 tournaments_df[col] = None
-                
+
         return tournaments_df
     else:
         # Return empty DataFrame with all required columns
         return pd.DataFrame(columns=REQUIRED_COLUMNS)
 
+# Per-line patterns used by parse_simple_date_club_city_format
+TRAILING_SPACED_CITY_RE = re.compile(r'\s{2,}([A-Za-z\s]+)$')
+CLUB_CITY_DATE_RE = re.compile(r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},\s+\d{4})')
+
 def parse_simple_date_club_city_format(text):
     """
     Parse format with Date, Club, City columns (often used for qualifiers).
     Example:
     May 18, 2025    Sandestin Resort & Club - Raven Course    Sandestin
     """
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     # Check if first line looks like headers and skip it
     if len(lines) > 1 and ("Date" in lines[0] and "Club" in lines[0] and "City" in lines[0]):
@@ -1992,8 +2054,7 @@ def parse_simple_date_club_city_format(text):
             continue
         
         # Step 1: Extract the date which is the most reliable part
-        date_pattern = r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},\s+\d{4})'
-        date_match = re.search(date_pattern, line)
+        date_match = CLUB_CITY_DATE_RE.search(line)
         
         if date_match:
             date_text = date_match.group(1)
@@ -2010,7 +2071,7 @@ def parse_simple_date_club_city_format(text):
                 city_name = rest_line[last_tab_pos+1:].strip()
             else:
                 # No tab found, look for multiple spaces at the end
-                match = re.search(r'\s{2,}([A-Za-z\s]+)$', rest_line)
+                match = TRAILING_SPACED_CITY_RE.search(rest_line)
                 if match:
                     city_name = match.group(1).strip()
                     course_name = rest_line[:match.start()].strip()
@@ -2063,7 +2124,7 @@ def parse_simple_date_club_city_format(text):
         for col in REQUIRED_COLUMNS:
             if col not in tournaments_df.columns:
                 tournaments_df[col] = None
-        
+
         # Explicitly set certain columns to empty string
         for col in ['Name', 'Category', 'Gender']:
             tournaments_df[col] = ""
@@ -2074,6 +2135,9 @@ def parse_simple_date_club_city_format(text):
         empty_df = pd.DataFrame(columns=REQUIRED_COLUMNS)
         return empty_df
     
+# Per-line patterns used by parse_missouri_tournament_format
+MISSOURI_REGION_STATE_RE = re.compile(r'\b(Missouri|MO|Iowa|IL|Illinois|Kansas|KS|Arkansas|AR|Oklahoma|OK|Tennessee|TN|Kentucky|KY|Nebraska|NE)\b')
+
 def parse_missouri_tournament_format(text):
     """
     Parse Missouri golf tournament format with day/month on separate lines.
@@ -2085,7 +2149,7 @@ def parse_missouri_tournament_format(text):
     Oakwood Country Club, Kansas City, Missouri
     Men's Tournament
     """
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     tournaments = []
     i = 0
@@ -2102,12 +2166,8 @@ def parse_missouri_tournament_format(text):
             tournament_type = lines[i+5]
             
             # Basic validation - check if first line is a number (day) and second is a month
-            month_names = ["January", "February", "March", "April", "May", "June", "July", "August", 
-                           "September", "October", "November", "December", "Jan", "Feb", "Mar", 
-                           "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-            
             is_day_number = day.isdigit() and 1 <= int(day) <= 31
-            is_month_name = any(m == month for m in month_names)
+            is_month_name = month in MONTH_NAME_SET
             
             if is_day_number and is_month_name:
                 # This pattern matches, extract tournament data
@@ -2137,7 +2197,7 @@ def parse_missouri_tournament_format(text):
                         location_part = parts[1].strip()
                         
                         # Try to extract state
-                        state_match = re.search(r'\b(Missouri|MO|Iowa|IL|Illinois|Kansas|KS|Arkansas|AR|Oklahoma|OK|Tennessee|TN|Kentucky|KY|Nebraska|NE)\b', location_part)
+                        state_match = MISSOURI_REGION_STATE_RE.search(location_part)
                         if state_match:
                             state = state_match.group(0)
                             # Convert full state names to abbreviations
@@ -2219,7 +2279,7 @@ def parse_missouri_tournament_format(text):
                 i += 1
         except Exception as e:
             # Error processing this group, skip to next line
-            st.write(f"Error processing group at index {i}: {str(e)}")
+            debug_write(f"Error processing group at index {i}: {str(e)}")
             i += 1
     
     # Convert to DataFrame
@@ -2232,12 +2292,15 @@ def parse_missouri_tournament_format(text):
         for col in REQUIRED_COLUMNS:
             if col not in tournaments_df.columns:
                 tournaments_df[col] = None
-                
+
         return tournaments_df
     else:
         # Return empty DataFrame with all required columns
         return pd.DataFrame(columns=REQUIRED_COLUMNS)
     
+# Per-line patterns used by parse_montana_format
+MONTANA_DATE_DASH_RE = re.compile(r'^([A-Za-z]+ \d{1,2}, \d{4})\s+-\s+(.+)$')
+
 def parse_montana_format(text):
     """
     Parse Montana golf tournament format with 3-line pattern:
@@ -2254,7 +2317,7 @@ def parse_montana_format(text):
     st.write("Running Montana parser v2.1")
     
     # Split into lines and remove empty lines
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     st.write(f"Total lines after cleaning: {len(lines)}")
     
     # Create a raw data display that we'll use for debugging
@@ -2272,7 +2335,7 @@ def parse_montana_format(text):
         try:
             # Skip month headers
             if lines[i].lower() in month_headers and len(lines[i]) < 10:
-                st.write(f"Skipping month header: '{lines[i]}'")
+                debug_write(f"Skipping month header: '{lines[i]}'")
                 i += 1
                 continue
             
@@ -2284,8 +2347,7 @@ def parse_montana_format(text):
                 line3 = lines[i+2]
                 
                 # Verify the second line has a date and dash
-                date_dash_pattern = r'^([A-Za-z]+ \d{1,2}, \d{4})\s+-\s+(.+)$'
-                date_match = re.search(date_dash_pattern, line2)
+                date_match = MONTANA_DATE_DASH_RE.search(line2)
                 
                 # Check if the third line has category keywords
                 category_keywords = ["mens", "men", "womens", "women", "seniors", "senior", 
@@ -2324,7 +2386,7 @@ def parse_montana_format(text):
                         location_part = location_parts[1].strip()
                         
                         # Look for state code at the end
-                        state_match = re.search(r'([A-Z]{2})$', location_part)
+                        state_match = STATE_CODE_END_RE.search(location_part)
                         if state_match:
                             state = state_match.group(1)
                             city = location_part[:-len(state)].strip()
@@ -2409,38 +2471,38 @@ def parse_montana_format(text):
                         tournaments.append(tournament_data)
                         
                         # Debug output
-                        st.write(f"Added tournament #{len(tournaments)}: {tournament_name}")
-                        st.write(f"  Date: {date_value} | Course: {course}")
+                        debug_write(f"Added tournament #{len(tournaments)}: {tournament_name}")
+                        debug_write(f"  Date: {date_value} | Course: {course}")
                         
                         # Skip to next tournament (3 lines)
                         i += 3
                     else:
                         # Invalid date
-                        st.write(f"Skipping line {i} - invalid date: {date_text}")
+                        debug_write(f"Skipping line {i} - invalid date: {date_text}")
                         i += 1
                 else:
                     # Not a tournament entry
-                    st.write(f"Skipping line {i} - not a tournament entry: {lines[i]}")
+                    debug_write(f"Skipping line {i} - not a tournament entry: {lines[i]}")
                     i += 1
             else:
                 # Not enough lines left
                 i += 1
         except Exception as e:
-            st.write(f"Error at line {i}: {str(e)}")
+            debug_write(f"Error at line {i}: {str(e)}")
             i += 1
     
     # Display debugging information
     if debug_data:
-        st.write("### Raw Parsed Data (for debugging)")
+        debug_write("### Raw Parsed Data (for debugging)")
         for entry in debug_data[:5]:  # Show first 5 entries
-            st.write(f"Tournament from line {entry['Index']+1}:")
-            st.write(f"  Line 1 (Name): {entry['Line1']}")
-            st.write(f"  Line 2 (Date-Course): {entry['Line2']}")
-            st.write(f"  Line 3 (Categories): {entry['Line3']}")
-            st.write(f"  Extracted Name: {entry['TournamentName']}")
-            st.write(f"  Extracted Date: {entry['DateText']} → {entry['DateValue']}")
-            st.write(f"  Extracted Course: {entry['Course']}")
-            st.write("---")
+            debug_write(f"Tournament from line {entry['Index']+1}:")
+            debug_write(f"  Line 1 (Name): {entry['Line1']}")
+            debug_write(f"  Line 2 (Date-Course): {entry['Line2']}")
+            debug_write(f"  Line 3 (Categories): {entry['Line3']}")
+            debug_write(f"  Extracted Name: {entry['TournamentName']}")
+            debug_write(f"  Extracted Date: {entry['DateText']} → {entry['DateValue']}")
+            debug_write(f"  Extracted Course: {entry['Course']}")
+            debug_write("---")
     
     # Convert to DataFrame
     if tournaments:
@@ -2467,7 +2529,7 @@ def parse_name_date_course_format(text):
     04.16
     Sycamore Ridge Golf Club, Spring Hill
     """
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     tournaments = []
     i = 0
@@ -2486,10 +2548,7 @@ def parse_name_date_course_format(text):
         date_line = lines[i]
         
         # Check if this is a date line in MM.DD format
-        date_pattern = r'^\d{2}\.\d{2}$'
-        date_range_pattern = r'^\d{2}\.\d{2}\s*/\s*\d{2}\.\d{2}$'
-        
-        date_match = re.match(date_pattern, date_line) or re.match(date_range_pattern, date_line)
+        date_match = MM_DD_DATE_LINE_RE.match(date_line)
         
         if date_match:
             # Process date - convert from MM.DD format to proper date
@@ -2546,7 +2605,7 @@ def parse_name_date_course_format(text):
                     city = parts[1].strip()
                     
                     # Check if the "city" contains state code
-                    state_match = re.search(r'([A-Z]{2})$', city)
+                    state_match = STATE_CODE_END_RE.search(city)
                     if state_match:
                         # Extract state code at the end
                         state = state_match.group(1)
@@ -2601,12 +2660,19 @@ def parse_name_date_course_format(text):
         for col in REQUIRED_COLUMNS:
             if col not in tournaments_df.columns:
                 tournaments_df[col] = None
-                
+
         return tournaments_df
     else:
         # Return empty DataFrame with all required columns
         return pd.DataFrame(columns=REQUIRED_COLUMNS)
     
+# Per-line patterns used by parse_monthly_entries_format
+MONTH_YEAR_LINE_RE = re.compile(r'^([A-Za-z]+)\s+(\d{4})$')
+MONTHLY_DATE_LINE_RE = re.compile(r'^([A-Za-z]+)\s+(\d{1,2})(?:–\d{1,2})?,\s+(\d{4})$')
+MONTHLY_DATE_RANGE_LINE_RE = re.compile(r'^([A-Za-z]+)\s+(\d{1,2})–(\d{1,2}),\s+(\d{4})$')
+MONTHLY_SINGLE_DATE_LINE_RE = re.compile(r'^([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})$')
+MONTH_WORD_DAY_PREFIX_RE = re.compile(r'^([A-Za-z]+)\s+\d{1,2}')
+
 def parse_monthly_entries_format(text, default_year="2025", default_state=None):
     """
     Parser for format with month headers and entry details:
@@ -2627,23 +2693,7 @@ def parse_monthly_entries_format(text, default_year="2025", default_state=None):
     """
     # Process text into lines
     lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
-    lines = [line.strip() for line in lines if line.strip()]
-    
-    # Month mapping for date conversion
-    month_map = {
-        'Jan': '01', 'January': '01', 
-        'Feb': '02', 'February': '02', 
-        'Mar': '03', 'March': '03', 
-        'Apr': '04', 'April': '04', 
-        'May': '05', 
-        'Jun': '06', 'June': '06', 
-        'Jul': '07', 'July': '07', 
-        'Aug': '08', 'August': '08', 
-        'Sep': '09', 'Sept': '09', 'September': '09', 
-        'Oct': '10', 'October': '10', 
-        'Nov': '11', 'November': '11', 
-        'Dec': '12', 'December': '12'
-    }
+    lines = [stripped for line in lines if (stripped := line.strip())]
     
     # List to store parsed tournaments
     tournaments = []
@@ -2655,16 +2705,16 @@ def parse_monthly_entries_format(text, default_year="2025", default_state=None):
     
     while i < len(lines):
         # Check if this is a month header line (e.g., "May 2025" or "June 2025")
-        month_year_match = re.match(r'^([A-Za-z]+)\s+(\d{4})$', lines[i])
+        month_year_match = MONTH_YEAR_LINE_RE.match(lines[i])
         if month_year_match:
             current_month = month_year_match.group(1)
             i += 1
             continue
         
         # Check if this is a date line (e.g., "May 19, 2025" or "Jun 3–5, 2025")
-        date_match = re.match(r'^([A-Za-z]+)\s+(\d{1,2})(?:–\d{1,2})?,\s+(\d{4})$', lines[i])
-        date_match2 = re.match(r'^([A-Za-z]+)\s+(\d{1,2})–(\d{1,2}),\s+(\d{4})$', lines[i])
-        date_match3 = re.match(r'^([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})$', lines[i])
+        date_match = MONTHLY_DATE_LINE_RE.match(lines[i])
+        date_match2 = MONTHLY_DATE_RANGE_LINE_RE.match(lines[i])
+        date_match3 = MONTHLY_SINGLE_DATE_LINE_RE.match(lines[i])
         
         if date_match or date_match2 or date_match3:
             # Extract date components
@@ -2675,7 +2725,7 @@ def parse_monthly_entries_format(text, default_year="2025", default_state=None):
             else:
                 month_name, day, year = date_match3.groups()
             
-            month = month_map.get(month_name[:3], '01')
+            month = MONTH_NUMBERS.get(month_name[:3], '01')
             date_value = f"{year}-{month}-{day.zfill(2)}"
             
             # Tournament name should be on the next line
@@ -2694,7 +2744,7 @@ def parse_monthly_entries_format(text, default_year="2025", default_state=None):
                     
                     if course_location_idx < len(lines):
                         # Check if this line is a date (which would mean we're at the next tournament)
-                        next_date_check = re.match(r'^([A-Za-z]+)\s+\d{1,2}', lines[course_location_idx])
+                        next_date_check = MONTH_WORD_DAY_PREFIX_RE.match(lines[course_location_idx])
                         if not next_date_check:
                             course_location = lines[course_location_idx]
                     
@@ -2771,7 +2821,7 @@ def parse_monthly_entries_format(text, default_year="2025", default_state=None):
                     }
                     
                     tournaments.append(tournament)
-                    st.write(f"✓ Added tournament: {tournament_name_only} at {course_name} on {date_value}")
+                    debug_write(f"✓ Added tournament: {tournament_name_only} at {course_name} on {date_value}")
                     
                     # Advance to next tournament
                     i = course_location_idx + 1 if course_location else i + 2
@@ -2796,6 +2846,14 @@ def parse_monthly_entries_format(text, default_year="2025", default_state=None):
         st.write("Monthly-Entries parser: NO tournaments found")
         return pd.DataFrame(columns=["Date", "Name", "Course", "Category", "Gender", "City", "State", "Zip"])
     
+# Per-line patterns used by parse_cdga_format
+COURSE_PAREN_LOCATION_RE = re.compile(r'(.*?)\s*\(([^,]+),\s*([A-Z]{2})\)')
+COMMA_STATE_CODE_WORD_RE = re.compile(r',\s*([A-Z]{2})(?:\s|$)')
+CDGA_DATE_RE = re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}(?:,?\s+\d{4})?')
+CDGA_DATE_RANGE_RE = re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}\s*-\s*\d{1,2},?\s+\d{4}')
+CDGA_MULTI_MONTH_RANGE_RE = re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}\s*-\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{1,2},?\s+\d{4}')
+CDGA_SIMPLE_RANGE_RE = re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}\s*-\s*\d{1,2},?\s+\d{4}')
+
 def parse_cdga_format(text):
     """
     Parse format with tournament name, date, day+course location, and status information.
@@ -2806,7 +2864,7 @@ def parse_cdga_format(text):
     Details  Tee Times
     Closed
     """
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     tournaments = []
     i = 0
@@ -2824,17 +2882,11 @@ def parse_cdga_format(text):
         # Second line should be date
         date_line = lines[i]
         
-        # Check if this is a date line
-        date_pattern = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}(?:,?\s+\d{4})?'
-        date_range_pattern = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}\s*-\s*\d{1,2},?\s+\d{4}'
-        multi_month_range_pattern = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}\s*-\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*\d{1,2},?\s+\d{4}'
-        simple_pattern = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}\s*-\s*\d{1,2},?\s+\d{4}'
-        
         # Check various date formats
-        if (re.match(date_pattern, date_line) or 
-            re.match(date_range_pattern, date_line) or 
-            re.match(multi_month_range_pattern, date_line) or
-            re.match(simple_pattern, date_line)):
+        if (CDGA_DATE_RE.match(date_line) or 
+            CDGA_DATE_RANGE_RE.match(date_line) or 
+            CDGA_MULTI_MONTH_RANGE_RE.match(date_line) or
+            CDGA_SIMPLE_RANGE_RE.match(date_line)):
             
             # Process date line
             if "-" in date_line:
@@ -2854,17 +2906,17 @@ def parse_cdga_format(text):
             day_course_line = lines[i] if i < len(lines) else ""
             i += 1
             
-            # Extract day of week
-            day_match = re.match(r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)', day_course_line)
+            # Extract day of week (plain prefix test, no regex needed for a literal list)
+            day_name = next((day for day in WEEKDAY_NAMES if day_course_line.startswith(day)), None)
             
-            if day_match:
+            if day_name:
                 # Remove day from the line
-                course_location = day_course_line[day_match.end():].strip()
+                course_location = day_course_line[len(day_name):].strip()
             else:
                 course_location = day_course_line
             
             # Look for course name and location in parentheses
-            location_match = re.search(r'(.*?)\s*\(([^,]+),\s*([A-Z]{2})\)', course_location)
+            location_match = COURSE_PAREN_LOCATION_RE.search(course_location)
             
             course_name = ""
             city = ""
@@ -2877,7 +2929,7 @@ def parse_cdga_format(text):
             else:
                 # Try another format - sometimes the location doesn't have parentheses
                 # Look for a comma followed by a state code
-                state_match = re.search(r',\s*([A-Z]{2})(?:\s|$)', course_location)
+                state_match = COMMA_STATE_CODE_WORD_RE.search(course_location)
                 
                 if state_match:
                     state = state_match.group(1)
@@ -2957,12 +3009,17 @@ def parse_cdga_format(text):
         for col in REQUIRED_COLUMNS:
             if col not in tournaments_df.columns:
                 tournaments_df[col] = None
-                
+
         return tournaments_df
     else:
         # Return empty DataFrame with all required columns
         return pd.DataFrame(columns=REQUIRED_COLUMNS)
     
+# Per-line patterns used by parse_events_with_sections_format
+COURSE_CITY_STATE_END_RE = re.compile(r'(.*?),\s+(.*?),\s+([A-Z]{2})$')
+SECTION_DATE_RE = re.compile(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}(?:-\d{1,2})?$')
+SECTION_DATE_RANGE_RE = re.compile(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}\s+-\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}$')
+
 def parse_events_with_sections_format(text):
     """
     Parse format with "Dates" and "Event Information" sections.
@@ -2974,7 +3031,7 @@ def parse_events_with_sections_format(text):
     U.S. Women's Amateur Four-Ball Championship
     Oklahoma City Golf & Country Club, Nichols Hills, OK
     """
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     # Check if the format includes "Dates" and "Event Information" headers
     has_sections = False
@@ -2990,10 +3047,7 @@ def parse_events_with_sections_format(text):
     
     while i < len(lines):
         # Look for date patterns
-        date_pattern = r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}(?:-\d{1,2})?$'
-        date_range_pattern = r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}\s+-\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}$'
-        
-        date_match = re.match(date_pattern, lines[i]) or re.match(date_range_pattern, lines[i])
+        date_match = SECTION_DATE_RE.match(lines[i]) or SECTION_DATE_RANGE_RE.match(lines[i])
         
         if date_match:
             date_text = lines[i]
@@ -3032,14 +3086,14 @@ def parse_events_with_sections_format(text):
             state = ""
             
             # Extract location information (City, State)
-            location_match = re.search(r'(.*?),\s+(.*?),\s+([A-Z]{2})$', course_location)
+            location_match = COURSE_CITY_STATE_END_RE.search(course_location)
             if location_match:
                 course_name = location_match.group(1).strip()
                 city = location_match.group(2).strip()
                 state = location_match.group(3).strip()
             else:
                 # Try alternative pattern
-                location_match = re.search(r'(.*?),\s+([A-Z]{2})$', course_location)
+                location_match = CITY_STATE_END_RE.search(course_location)
                 if location_match:
                     parts = location_match.group(1).strip().rsplit(",", 1)
                     if len(parts) == 2:
@@ -3099,12 +3153,24 @@ def parse_events_with_sections_format(text):
         for col in REQUIRED_COLUMNS:
             if col not in tournaments_df.columns:
                 tournaments_df[col] = None
-                
+
         return tournaments_df
     else:
         # Return empty DataFrame with all required columns
         return pd.DataFrame(columns=REQUIRED_COLUMNS)
 
+# Per-line patterns used by detect_format
+MONTANA_DATE_COURSE_RE = re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}\s+-')
+# "06.14" or "06.14 / 06.15" on a line by itself
+MM_DD_DATE_LINE_RE = re.compile(r'^\d{2}\.\d{2}(?:\s*/\s*\d{2}\.\d{2})?$')
+ABBR_MONTH_DAY_PREFIX_RE = re.compile(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}')
+ABBR_MONTH_DAY_RANGE_PREFIX_RE = re.compile(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}\s+-\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}')
+COMMA_STATE_CODE_RE = re.compile(r'.*?,\s+[A-Z]{2}')
+SCHEDULE_DATE_PREFIX_RE = re.compile(r'^(' + '|'.join(MONTH_NUMBERS) + r'\.?\s+\d{1,2}(?:[^\w]|$))')
+WEEKDAY_DATE_YEAR_LINE_RE = re.compile(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+[A-Za-z]{3}\s+\d{1,2},\s+\d{4}$')
+CHAMPIONSHIP_NAME_RE = re.compile(r'(?:\*\*)?(.*?(?:Championship|Tournament|Cup|Series|Amateur|Open))')
+MONTH_NAME_DAY_PREFIX_RE = re.compile(r'^(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}')
+
 def detect_format(text):
     """Detect which format the text is in."""
      # Split the text into lines and check for patterns
@@ -3114,7 +3180,7 @@ def detect_format(text):
     montana_pattern_count = 0
     for i in range(len(lines) - 2):
         if (len(lines[i]) > 5 and  # Tournament name
-            re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}\s+-', lines[i+1]) and  # Date - Course
+            MONTANA_DATE_COURSE_RE.search(lines[i+1]) and  # Date - Course
             any(category in lines[i+2].lower() for category in ["mens", "womens", "seniors", "juniors", "team", "pro", "am"])):  # Categories
             montana_pattern_count += 1
     
@@ -3123,15 +3189,12 @@ def detect_format(text):
 
     # Check for Missouri format with day/month on separate lines followed by tournament name
     missouri_pattern_count = 0
-    month_names = ["January", "February", "March", "April", "May", "June", "July", "August", 
-                 "September", "October", "November", "December", "Jan", "Feb", "Mar", 
-                 "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
     
     for i in range(len(lines) - 5):
         if (lines[i].isdigit() and 1 <= int(lines[i]) <= 31 and
-            lines[i+1] in month_names and
+            lines[i+1] in MONTH_NAME_SET and
             len(lines[i+2]) > 5 and  # Tournament name
-            any(month in lines[i+3] for month in month_names) and  # Date with month
+            any(month in lines[i+3] for month in MONTH_NUMBERS) and  # Date with month
             "," in lines[i+4] and  # Course, City, State
             "Tournament" in lines[i+5]):  # Tournament type
             missouri_pattern_count += 1
@@ -3166,7 +3229,7 @@ def detect_format(text):
     club_count = 0
     
     for i in range(len(lines)):
-        if re.match(r'^\d{2}\.\d{2}$', lines[i]) or re.match(r'^\d{2}\.\d{2}\s*/\s*\d{2}\.\d{2}$', lines[i]):
+        if MM_DD_DATE_LINE_RE.match(lines[i]):
             mm_dd_date_count += 1
         if i > 0 and i + 1 < len(lines) and (
             "Club" in lines[i] or "Course" in lines[i] or "Golf" in lines[i]) and "," in lines[i]:
@@ -3204,11 +3267,11 @@ def detect_format(text):
     entries_close_count = 0
     date_range_count = 0
     for i in range(len(lines)):
-        if i > 0 and "Entries Close:" in lines[i] and re.match(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}', lines[i-1]):
+        if i > 0 and "Entries Close:" in lines[i] and ABBR_MONTH_DAY_PREFIX_RE.match(lines[i-1]):
             entries_close_count += 1
         
         # Also count date ranges
-        if re.match(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}\s+-\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}', lines[i]):
+        if ABBR_MONTH_DAY_RANGE_PREFIX_RE.match(lines[i]):
             date_range_count += 1
     
     if entries_close_count >= 3:
@@ -3225,7 +3288,7 @@ def detect_format(text):
         # Check for date patterns like 3/3 - 3/4
         date_pattern_count = 0
         for line in lines:
-            if re.search(r'\d{1,2}/\d{1,2}(?:\s*-\s*(?:\d{1,2}/\d{1,2}|\d{1,2}))?$', line):
+            if SLASH_DATE_RANGE_END_RE.search(line):
                 date_pattern_count += 1
         
         if date_pattern_count >= 3:
@@ -3235,7 +3298,7 @@ def detect_format(text):
     # Look for consistent date patterns at the end of lines
     date_pattern_lines = 0
     for line in lines:
-        if re.search(r'\d{1,2}/\d{1,2}(?:\s*-\s*(?:\d{1,2}/\d{1,2}|\d{1,2}))?$', line):
+        if SLASH_DATE_RANGE_END_RE.search(line):
             date_pattern_lines += 1
     
     if date_pattern_lines >= 5 and date_pattern_lines > len(lines) * 0.25:
@@ -3257,13 +3320,10 @@ def detect_format(text):
             (i + 4 >= len(lines) or not lines[i+4])):  # Followed by blank line or end
             
             # Check if 3rd line looks like a location (City, ST)
-            if re.search(r'.*?,\s+[A-Z]{2}', lines[i+2]):
+            if COMMA_STATE_CODE_RE.search(lines[i+2]):
                 # Check if 4th line looks like a date
                 date_line = lines[i+3]
-                month_names = ["January", "February", "March", "April", "May", "June", "July", "August", 
-                              "September", "October", "November", "December", "Jan", "Feb", "Mar", 
-                              "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-                if any(month in date_line for month in month_names):
+                if any(month in date_line for month in MONTH_NUMBERS):
                     four_line_pattern_count += 1
             
             # Skip ahead to the next block
@@ -3284,14 +3344,9 @@ def detect_format(text):
         return "BULLETED_MARKDOWN_FORMAT"
     
     # Check for schedule format with dates followed by event name on same line
-    month_names = ["January", "February", "March", "April", "May", "June", "July", "August", 
-                  "September", "October", "November", "December", "Jan", "Feb", "Mar", 
-                  "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-    date_prefix_pattern = r'^(' + '|'.join(month_names) + r'\.?\s+\d{1,2}(?:[^\w]|$))'
-    
     schedule_format_count = 0
     for line in lines:
-        if re.match(date_prefix_pattern, line.strip()) and len(line) > 20:
+        if SCHEDULE_DATE_PREFIX_RE.match(line.strip()) and len(line) > 20:
             schedule_format_count += 1
     
     if schedule_format_count >= 3:
@@ -3308,7 +3363,7 @@ def detect_format(text):
             course_prefix_count += 1
         if lines[i].startswith("Golfers:"):
             golfers_prefix_count += 1
-        if i < len(lines) - 1 and re.match(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+[A-Za-z]{3}\s+\d{1,2},\s+\d{4}$', lines[i]):
+        if i < len(lines) - 1 and WEEKDAY_DATE_YEAR_LINE_RE.match(lines[i]):
             date_with_year_count += 1
         if lines[i] == "View":
             view_count += 1
@@ -3330,14 +3385,13 @@ def detect_format(text):
         return "USGA_QUALIFIER_FORMAT"
     
     # Check for status-based format (OPEN/OPENS/CLOSED with View)
-    status_keywords = ["OPEN", "OPENS", "CLOSED", "REGISTRATION OPEN", "SOLD OUT", "INVITATION LIST"]
     status_count = 0
     action_count = 0
     
     for line in lines:
-        if any(line == keyword for keyword in status_keywords):
+        if line in STATUS_KEYWORDS:
             status_count += 1
-        if line == "View" or line == "Register" or line == "Details":
+        if line in ACTION_LINES:
             action_count += 1
     
     if status_count >= 2 and action_count >= 2:
@@ -3359,14 +3413,11 @@ def detect_format(text):
     
     # Look for a pattern of 4-line entries with a date range on the 4th line
     if len(lines) >= 4:
-        month_names = ["January", "February", "March", "April", "May", "June", "July", "August", 
-                      "September", "October", "November", "December", "Jan", "Feb", "Mar", 
-                      "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
         
         # Check if every 4th line has a month name and a dash (indicating date range)
         date_ranges = 0
         for i in range(3, len(lines), 4):
-            if i < len(lines) and any(month in lines[i] for month in month_names) and "-" in lines[i]:
+            if i < len(lines) and any(month in lines[i] for month in MONTH_NUMBERS) and "-" in lines[i]:
                 date_ranges += 1
         
         if date_ranges >= 1:
@@ -3376,27 +3427,29 @@ def detect_format(text):
     if len(lines) > 0 and ("Date\tTournaments\t" in lines[0] or "Date    Tournaments    " in lines[0]):
         return "TABULAR"
     
+    # Count championship names and month-day lines in a single pass
     championship_count = 0
+    date_count = 0
     for line in lines[:20]:
-        if re.search(r'(?:\*\*)?(.*?(?:Championship|Tournament|Cup|Series|Amateur|Open))', line):
+        if CHAMPIONSHIP_NAME_RE.search(line):
             championship_count += 1
+        if MONTH_NAME_DAY_PREFIX_RE.match(line):
+            date_count += 1
     
     if championship_count >= 2:
         return "CHAMPIONSHIP"
     
-    date_count = 0
-    for line in lines[:20]:
-        if re.match(r'^(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}', line):
-            date_count += 1
-    
     if date_count >= 2:
         return "MANUAL_TABULAR"
     
     return "SIMPLE"
 
+# Per-line patterns used by parse_markdown_format
+BOLD_TEXT_RE = re.compile(r'\*\*(.*?)\*\*')
+
 def parse_markdown_format(text):
     """Parse markdown format with bullet points and bold text."""
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     tournaments = []
     
@@ -3406,7 +3459,7 @@ def parse_markdown_format(text):
             continue
         
         # Extract tournament name (text in bold)
-        name_match = re.search(r'\*\*(.*?)\*\*', line)
+        name_match = BOLD_TEXT_RE.search(line)
         if not name_match:
             continue
             
@@ -3416,7 +3469,7 @@ def parse_markdown_format(text):
         after_name_text = line[line.find(name_match.group(0)) + len(name_match.group(0)):].strip()
         
         # Split the text by state code (2 capital letters) to get course+city and date
-        state_match = re.search(r'\b([A-Z]{2})\b', after_name_text)
+        state_match = STATE_CODE_WORD_RE.search(after_name_text)
         if not state_match:
             continue
             
@@ -3454,14 +3507,7 @@ def parse_markdown_format(text):
             }
             
             # Determine category based on tournament name
-            if "Amateur" in name:
-                tournament['Category'] = "Amateur"
-            elif "Senior" in name:
-                tournament['Category'] = "Seniors"
-            elif "Women" in name or "Ladies" in name:
-                tournament['Category'] = "Women's"
-            elif "Junior" in name or "Boys'" in name or "Girls'" in name:
-                tournament['Category'] = "Junior's"
+            tournament['Category'] = infer_category(name)
             
             # Add the tournament to our list
             tournaments.append(tournament)
@@ -3470,7 +3516,7 @@ def parse_markdown_format(text):
     if tournaments:
         st.write(f"Debug: Found {len(tournaments)} tournaments in markdown format")
         for i, t in enumerate(tournaments[:5]):
-            st.write(f"Tournament {i+1}: {t['Name']}, Date: {t['Date']}")
+            debug_write(f"Tournament {i+1}: {t['Name']}, Date: {t['Date']}")
         
         tournaments_df = pd.DataFrame(tournaments)
         return inspect_dataframe(tournaments_df)
@@ -3480,7 +3526,7 @@ def parse_markdown_format(text):
 
 def parse_custom_format(text):
     """Custom parser for the specific format observed in the data."""
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     tournaments = []
     
@@ -3499,7 +3545,7 @@ def parse_custom_format(text):
                 date_range = line
                 
                 # Parse location for city and state
-                location_match = re.search(r'(.*?),\s+([A-Z]{2})', location)
+                location_match = CITY_STATE_RE.search(location)
                 city = ""
                 state = ""
                 if location_match:
@@ -3522,14 +3568,7 @@ def parse_custom_format(text):
                     }
                     
                     # Determine category based on tournament name
-                    if "Amateur" in name:
-                        tournament['Category'] = "Amateur"
-                    elif "Senior" in name:
-                        tournament['Category'] = "Seniors"
-                    elif "Women" in name or "Ladies" in name:
-                        tournament['Category'] = "Women's"
-                    elif "Junior" in name or "Boys'" in name or "Girls'" in name:
-                        tournament['Category'] = "Junior's"
+                    tournament['Category'] = infer_category(name)
                     
                     # Add the tournament to our list
                     tournaments.append(tournament)
@@ -3544,7 +3583,7 @@ def parse_custom_format(text):
         for col in REQUIRED_COLUMNS:
             if col not in tournaments_df.columns:
                 tournaments_df[col] = None
-                
+
         return tournaments_df
     else:
         # Return empty DataFrame with all required columns
@@ -3570,14 +3609,7 @@ def parse_course_tournament_format(text, year="2025", default_state=None):
     """
     # Process text into lines
     lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
-    lines = [line.strip() for line in lines if line.strip()]
-    
-    # Month mapping for date conversion
-    month_map = {
-        'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04', 
-        'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
-        'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-    }
+    lines = [stripped for line in lines if (stripped := line.strip())]
     
     # List to store parsed tournaments
     tournaments = []
@@ -3595,7 +3627,7 @@ def parse_course_tournament_format(text, year="2025", default_state=None):
             date_range = lines[i+4]
             
             # Debugging output
-            st.write(f"Checking lines {i}-{i+4}: Course1='{course1}', Course2='{course2}'")
+            debug_write(f"Checking lines {i}-{i+4}: Course1='{course1}', Course2='{course2}'")
             
             # Determine if courses match or are similar
             courses_match = False
@@ -3612,10 +3644,10 @@ def parse_course_tournament_format(text, year="2025", default_state=None):
                     courses_match = True
             
             if courses_match:
-                st.write(f"✓ Courses match at line {i}")
+                debug_write(f"✓ Courses match at line {i}")
                 
                 # Extract city and state from location line
-                location_match = re.search(r'(.*?),\s+([A-Z]{2})$', location)
+                location_match = CITY_STATE_END_RE.search(location)
                 city = ""
                 state = default_state
                 
@@ -3630,17 +3662,17 @@ def parse_course_tournament_format(text, year="2025", default_state=None):
                     first_part = date_range.split("-")[0].strip()
                     
                     # Try standard format first (May 17, 2025)
-                    date_match = re.search(r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})', first_part)
+                    date_match = MONTH_DAY_YEAR_RE.search(first_part)
                     if date_match:
                         month_name, day, yr = date_match.groups()
-                        month = month_map.get(month_name[:3], '01')  # Get month number
+                        month = MONTH_NUMBERS.get(month_name[:3], '01')  # Get month number
                         date_value = f"{yr}-{month}-{day.zfill(2)}"
                 else:
                     # Single date
-                    date_match = re.search(r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})', date_range)
+                    date_match = MONTH_DAY_YEAR_RE.search(date_range)
                     if date_match:
                         month_name, day, yr = date_match.groups()
-                        month = month_map.get(month_name[:3], '01')  # Get month number
+                        month = MONTH_NUMBERS.get(month_name[:3], '01')  # Get month number
                         date_value = f"{yr}-{month}-{day.zfill(2)}"
                 
                 # Only add if we have a valid date
@@ -3683,7 +3715,7 @@ def parse_course_tournament_format(text, year="2025", default_state=None):
                     }
                     
                     tournaments.append(tournament)
-                    st.write(f"✓ Added tournament at line {i}: {tournament_name}")
+                    debug_write(f"✓ Added tournament at line {i}: {tournament_name}")
                 
                 # Move to next block of 5 lines
                 i += 5
@@ -3691,7 +3723,7 @@ def parse_course_tournament_format(text, year="2025", default_state=None):
                 # If pattern doesn't match, move forward by 1 line
                 i += 1
         except Exception as e:
-            st.write(f"Error processing tournament at line {i}: {str(e)}")
+            debug_write(f"Error processing tournament at line {i}: {str(e)}")
             i += 1
     
     # Convert to DataFrame
@@ -3707,6 +3739,11 @@ def parse_course_tournament_format(text, year="2025", default_state=None):
         # Return empty DataFrame with required columns
         st.write("Course-Tournament parser: NO tournaments found")
         return pd.DataFrame(columns=["Date", "Name", "Course", "Category", "Gender", "City", "State", "Zip"])
+
+# Per-line patterns used by parse_golf_genius_format
+GOLF_GENIUS_DATE_RE = re.compile(r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+([A-Za-z]{3})\s+(\d{1,2})(?:\s*-\s*[A-Za-z,\s\d]+)?,\s+(\d{4})')
+GOLF_GENIUS_RANGE_RE = re.compile(r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+([A-Za-z]{3})\s+(\d{1,2})\s*-\s*(?:[A-Za-z,\s]+),\s+(\d{4})')
+
 def parse_golf_genius_format(text, default_year="2025", default_state=None):
     """
     Parser for Golf Genius format with "View" lines and tournament details.
@@ -3727,26 +3764,16 @@ def parse_golf_genius_format(text, default_year="2025", default_state=None):
     import re
     import pandas as pd
     
-    # Month mapping
-    month_map = {
-        'JAN': '01', 'FEB': '02', 'MAR': '03', 'APR': '04', 
-        'MAY': '05', 'JUN': '06', 'JUL': '07', 'AUG': '08',
-        'SEP': '09', 'OCT': '10', 'NOV': '11', 'DEC': '12',
-        'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04', 
-        'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
-        'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-    }
-    
     # Process the lines
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     tournaments = []
     i = 0
     
     # Print the first 15 lines for debugging
-    st.write("First 15 lines for debugging (Golf Genius format):")
+    debug_write("First 15 lines for debugging (Golf Genius format):")
     for j in range(min(15, len(lines))):
-        st.write(f"Line {j+1}: '{lines[j]}'")
+        debug_write(f"Line {j+1}: '{lines[j]}'")
     
     # Process the file
     while i < len(lines):
@@ -3769,16 +3796,16 @@ def parse_golf_genius_format(text, default_year="2025", default_state=None):
                 i += 1
                 
                 # Skip status lines (OPEN, CLOSED, etc.)
-                while i < len(lines) and (lines[i] in ["OPEN", "CLOSED", "REGISTRATION OPEN"] or 
+                while i < len(lines) and (lines[i] in GOLF_GENIUS_STATUS_LINES or 
                                          lines[i].startswith("closes on") or
-                                         re.match(r'^[A-Z]{3},\s+[A-Z]{3}', lines[i]) or
-                                         re.match(r'^\d{1,2}:\d{2}\s+[AP]M', lines[i])):
+                                         UPPER_WEEKDAY_MONTH_PREFIX_RE.match(lines[i]) or
+                                         TIME_PREFIX_RE.match(lines[i])):
                     i += 1
                 
                 # Extract date
                 date_value = None
                 # Try different date formats
-                date_match = re.search(r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+([A-Za-z]{3})\s+(\d{1,2})(?:\s*-\s*[A-Za-z,\s\d]+)?,\s+(\d{4})', date_line)
+                date_match = GOLF_GENIUS_DATE_RE.search(date_line)
                 
                 if date_match:
                     month_abbr = date_match.group(1)
@@ -3786,20 +3813,20 @@ def parse_golf_genius_format(text, default_year="2025", default_state=None):
                     year = date_match.group(3)
                     
                     # Convert month name to number
-                    month = month_map.get(month_abbr, '01')
+                    month = GOLF_GENIUS_MONTHS.get(month_abbr, '01')
                     
                     # Format date
                     date_value = f"{year}-{month}-{day.zfill(2)}"
                 else:
                     # Try date range format
-                    range_match = re.search(r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+([A-Za-z]{3})\s+(\d{1,2})\s*-\s*(?:[A-Za-z,\s]+),\s+(\d{4})', date_line)
+                    range_match = GOLF_GENIUS_RANGE_RE.search(date_line)
                     if range_match:
                         month_abbr = range_match.group(1)
                         day = range_match.group(2)
                         year = range_match.group(3)
                         
                         # Convert month name to number
-                        month = month_map.get(month_abbr, '01')
+                        month = GOLF_GENIUS_MONTHS.get(month_abbr, '01')
                         
                         # Format date
                         date_value = f"{year}-{month}-{day.zfill(2)}"
@@ -3851,12 +3878,12 @@ def parse_golf_genius_format(text, default_year="2025", default_state=None):
                     
                     # Add to results
                     tournaments.append(tournament)
-                    st.write(f"✓ Added tournament: {tournament_name}")
+                    debug_write(f"✓ Added tournament: {tournament_name}")
             else:
                 # Not a tournament start, move to next line
                 i += 1
         except Exception as e:
-            st.write(f"⚠ Error processing line {i+1}: {str(e)}")
+            debug_write(f"⚠ Error processing line {i+1}: {str(e)}")
             i += 1  # Move forward in case of error
     
     # Convert to DataFrame - with specific column ordering
@@ -3877,6 +3904,9 @@ def parse_golf_genius_format(text, default_year="2025", default_state=None):
         st.write("Golf Genius Parser: No tournaments found")
         return pd.DataFrame(columns=["Date", "Name", "Course", "Category", "Gender", "City", "State", "Zip"])
 
+# Per-line patterns used by parse_golf_tournament_series_format
+PRICE_PREFIX_RE = re.compile(r'^\$\d+')
+
 def parse_golf_tournament_series_format(text, default_year="2025", default_state=None):
     """
     Parser for Golf Tournament Series format.
@@ -3894,23 +3924,13 @@ def parse_golf_tournament_series_format(text, default_year="2025", default_state
     import re
     import pandas as pd
     
-    # Month mapping for date conversion
-    month_map = {
-        'January': '01', 'February': '02', 'March': '03', 'April': '04',
-        'May': '05', 'June': '06', 'July': '07', 'August': '08',
-        'September': '09', 'October': '10', 'November': '11', 'December': '12',
-        'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04',
-        'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
-        'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-    }
-    
     # Process the lines
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     # Display first 15 lines for debugging
-    st.write("First 15 lines for debugging (Golf Tournament Series format):")
+    debug_write("First 15 lines for debugging (Golf Tournament Series format):")
     for i in range(min(15, len(lines))):
-        st.write(f"Line {i+1}: '{lines[i]}'")
+        debug_write(f"Line {i+1}: '{lines[i]}'")
     
     # Tournament entries to collect
     tournaments = []
@@ -3927,14 +3947,10 @@ def parse_golf_tournament_series_format(text, default_year="2025", default_state
             # Key pattern: A few lines followed by a price line (with $) and then a date line
             
             # Check if the 5th line contains a price (starts with $)
-            price_pattern = r'^\$\d+'
-            
-            # Check if the 6th line is a date (month followed by day)
-            date_pattern = r'^(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}'
-            
+            # and the 6th line is a date (month followed by day)
             if (i + 5 < len(lines) and 
-                re.search(price_pattern, lines[i+4]) and 
-                re.search(date_pattern, lines[i+5])):
+                PRICE_PREFIX_RE.search(lines[i+4]) and 
+                MONTH_NAME_DAY_PREFIX_RE.search(lines[i+5])):
                 
                 # This looks like a tournament block!
                 tournament_name = lines[i]
@@ -3953,7 +3969,7 @@ def parse_golf_tournament_series_format(text, default_year="2025", default_state
                 state = default_state
                 
                 # Extract city and state
-                location_match = re.search(r'(.*?),\s+([A-Z]{2})$', location_line)
+                location_match = CITY_STATE_END_RE.search(location_line)
                 if location_match:
                     city = location_match.group(1).strip()
                     state = location_match.group(2).strip()
@@ -3962,7 +3978,7 @@ def parse_golf_tournament_series_format(text, default_year="2025", default_state
                 date_line = lines[i+5]
                 
                 # Extract date components
-                date_match = re.search(r'([A-Za-z]+)\s+(\d{1,2})', date_line)
+                date_match = MONTH_DAY_RE.search(date_line)
                 
                 date_value = None
                 if date_match:
@@ -3970,17 +3986,17 @@ def parse_golf_tournament_series_format(text, default_year="2025", default_state
                     day = date_match.group(2)
                     
                     # Convert month to number
-                    month = month_map.get(month_name, '01')
+                    month = MONTH_NUMBERS.get(month_name, '01')
                     
                     # Create ISO date format
                     date_value = f"{default_year}-{month}-{day.zfill(2)}"
                 
                 # Debug output
-                st.write(f"Processing tournament block at line {i+1}:")
-                st.write(f"  Name: '{tournament_name}'")
-                st.write(f"  Course: '{course}'")
-                st.write(f"  Location: '{location_line}' -> City: '{city}', State: '{state}'")
-                st.write(f"  Date: '{date_line}' -> '{date_value}'")
+                debug_write(f"Processing tournament block at line {i+1}:")
+                debug_write(f"  Name: '{tournament_name}'")
+                debug_write(f"  Course: '{course}'")
+                debug_write(f"  Location: '{location_line}' -> City: '{city}', State: '{state}'")
+                debug_write(f"  Date: '{date_line}' -> '{date_value}'")
                 
                 # Determine category and gender (basic defaults)
                 category = "Tournament"  # Default
@@ -4019,7 +4035,7 @@ def parse_golf_tournament_series_format(text, default_year="2025", default_state
                     }
                     
                     tournaments.append(tournament)
-                    st.write(f"✓ Added tournament: {tournament_name}")
+                    debug_write(f"✓ Added tournament: {tournament_name}")
                 
                 # Move to the next block - skip 6 lines plus any blank lines
                 i += 6
@@ -4031,7 +4047,7 @@ def parse_golf_tournament_series_format(text, default_year="2025", default_state
                 # Not a recognizable tournament block, move to next line
                 i += 1
         except Exception as e:
-            st.write(f"⚠ Error processing line {i+1}: {str(e)}")
+            debug_write(f"⚠ Error processing line {i+1}: {str(e)}")
             i += 1  # Move forward in case of error
     
     # Convert to DataFrame
@@ -4052,6 +4068,11 @@ def parse_golf_tournament_series_format(text, default_year="2025", default_state
         st.write("Golf Tournament Series Parser: No tournaments found")
         return pd.DataFrame(columns=["Date", "Name", "Course", "Category", "Gender", "City", "State", "Zip"])
 
+# Per-line patterns used by parse_golf_association_format
+MONTH_DAY_COMMA_YEAR_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})')
+MONTH_DAY_SPACE_YEAR_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2})\s+\d{4}')
+ANY_FOUR_DIGITS_RE = re.compile(r'(\d{4})')
+
 def parse_golf_association_format(text, default_year="2025", default_state=None):
     """
     Parser for Golf Association format with tournament information and logos.
@@ -4073,23 +4094,13 @@ def parse_golf_association_format(text, default_year="2025", default_state=None)
     import re
     import pandas as pd
     
-    # Month mapping for date conversion
-    month_map = {
-        'January': '01', 'February': '02', 'March': '03', 'April': '04',
-        'May': '05', 'June': '06', 'July': '07', 'August': '08',
-        'September': '09', 'October': '10', 'November': '11', 'December': '12',
-        'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04',
-        'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
-        'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-    }
-    
     # Process the lines
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     # Display first 20 lines for debugging
-    st.write("First 20 lines for debugging (Golf Association format):")
+    debug_write("First 20 lines for debugging (Golf Association format):")
     for i in range(min(20, len(lines))):
-        st.write(f"Line {i+1}: '{lines[i]}'")
+        debug_write(f"Line {i+1}: '{lines[i]}'")
     
     # Tournament entries to collect
     tournaments = []
@@ -4153,7 +4164,7 @@ def parse_golf_association_format(text, default_year="2025", default_state=None)
                 
                 # Process the date
                 date_value = None
-                date_match = re.search(r'([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})', date_line)
+                date_match = MONTH_DAY_COMMA_YEAR_RE.search(date_line)
                 
                 if date_match:
                     month_name = date_match.group(1)
@@ -4161,23 +4172,23 @@ def parse_golf_association_format(text, default_year="2025", default_state=None)
                     year = date_match.group(3)
                     
                     # Get month number
-                    month = month_map.get(month_name, '01')
+                    month = MONTH_NUMBERS.get(month_name, '01')
                     
                     # Format date
                     date_value = f"{year}-{month}-{day.zfill(2)}"
                 else:
                     # Try alternative date format without comma
-                    alt_match = re.search(r'([A-Za-z]+)\s+(\d{1,2})\s+\d{4}', date_line)
+                    alt_match = MONTH_DAY_SPACE_YEAR_RE.search(date_line)
                     if alt_match:
                         month_name = alt_match.group(1)
                         day = alt_match.group(2)
                         
                         # Extract year separately
-                        year_match = re.search(r'(\d{4})', date_line)
+                        year_match = ANY_FOUR_DIGITS_RE.search(date_line)
                         year = year_match.group(1) if year_match else default_year
                         
                         # Get month number
-                        month = month_map.get(month_name, '01')
+                        month = MONTH_NUMBERS.get(month_name, '01')
                         
                         # Format date
                         date_value = f"{year}-{month}-{day.zfill(2)}"
@@ -4224,12 +4235,12 @@ def parse_golf_association_format(text, default_year="2025", default_state=None)
                     }
                     
                     tournaments.append(tournament)
-                    st.write(f"✓ Added tournament: {tournament_name}")
+                    debug_write(f"✓ Added tournament: {tournament_name}")
             else:
                 # Not a tournament start, move to next line
                 i += 1
         except Exception as e:
-            st.write(f"⚠ Error processing line {i+1}: {str(e)}")
+            debug_write(f"⚠ Error processing line {i+1}: {str(e)}")
             i += 1  # Move forward in case of error
     
     # Convert to DataFrame
@@ -4250,6 +4261,10 @@ def parse_golf_association_format(text, default_year="2025", default_state=None)
         st.write("Golf Association Parser: No tournaments found")
         return pd.DataFrame(columns=["Date", "Name", "Course", "Category", "Gender", "City", "State", "Zip"])
 
+# Per-line patterns used by parse_oga_format
+MONTH_DAY_TO_MONTH_DAY_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2})\s*-\s*([A-Za-z]+)\s+(\d{1,2})')
+COURSE_DASH_CITY_RE = re.compile(r'(.*?)\s+-\s+(.*?)$')
+
 def parse_oga_format(text, default_year="2025", default_state=None):
     """
     Parser for Oregon Golf Association (OGA) event format.
@@ -4266,23 +4281,13 @@ def parse_oga_format(text, default_year="2025", default_state=None):
     import re
     import pandas as pd
     
-    # Month mapping for date conversion
-    month_map = {
-        'January': '01', 'February': '02', 'March': '03', 'April': '04',
-        'May': '05', 'June': '06', 'July': '07', 'August': '08',
-        'September': '09', 'October': '10', 'November': '11', 'December': '12',
-        'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04',
-        'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
-        'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-    }
-    
     # Process the lines
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     # Display first 15 lines for debugging
-    st.write("First 15 lines for debugging (OGA format):")
+    debug_write("First 15 lines for debugging (OGA format):")
     for i in range(min(15, len(lines))):
-        st.write(f"Line {i+1}: '{lines[i]}'")
+        debug_write(f"Line {i+1}: '{lines[i]}'")
     
     # Tournament entries to collect
     tournaments = []
@@ -4305,16 +4310,16 @@ def parse_oga_format(text, default_year="2025", default_state=None):
                 course_city_line = lines[i+3]  # Fourth line is course/city
                 
                 # Debug output
-                st.write(f"Block at line {i+1}:")
-                st.write(f"  Name: '{tournament_name}'")
-                st.write(f"  Date: '{date_line}'")
-                st.write(f"  Course/City: '{course_city_line}'")
+                debug_write(f"Block at line {i+1}:")
+                debug_write(f"  Name: '{tournament_name}'")
+                debug_write(f"  Date: '{date_line}'")
+                debug_write(f"  Course/City: '{course_city_line}'")
                 
                 # Extract date
                 date_value = None
                 
                 # Check for date range format (e.g., "May 31 - June 1")
-                date_range_match = re.search(r'([A-Za-z]+)\s+(\d{1,2})\s*-\s*([A-Za-z]+)\s+(\d{1,2})', date_line)
+                date_range_match = MONTH_DAY_TO_MONTH_DAY_RE.search(date_line)
                 
                 if date_range_match:
                     # Use the start date from the range
@@ -4322,20 +4327,20 @@ def parse_oga_format(text, default_year="2025", default_state=None):
                     day = date_range_match.group(2)
                     
                     # Get month number
-                    month = month_map.get(month_name, '01')
+                    month = MONTH_NUMBERS.get(month_name, '01')
                     
                     # Format date
                     date_value = f"{default_year}-{month}-{day.zfill(2)}"
                 else:
                     # Check for simple date format (e.g., "May 28")
-                    simple_date_match = re.search(r'([A-Za-z]+)\s+(\d{1,2})', date_line)
+                    simple_date_match = MONTH_DAY_RE.search(date_line)
                     
                     if simple_date_match:
                         month_name = simple_date_match.group(1)
                         day = simple_date_match.group(2)
                         
                         # Get month number
-                        month = month_map.get(month_name, '01')
+                        month = MONTH_NUMBERS.get(month_name, '01')
                         
                         # Format date
                         date_value = f"{default_year}-{month}-{day.zfill(2)}"
@@ -4345,7 +4350,7 @@ def parse_oga_format(text, default_year="2025", default_state=None):
                 city = None
                 
                 # Course-City format: "Course - City"
-                course_city_match = re.search(r'(.*?)\s+-\s+(.*?)$', course_city_line)
+                course_city_match = COURSE_DASH_CITY_RE.search(course_city_line)
                 
                 if course_city_match:
                     course = course_city_match.group(1).strip()
@@ -4389,7 +4394,7 @@ def parse_oga_format(text, default_year="2025", default_state=None):
                 # If we have valid core data, create an entry
                 if date_value and fixed_name and fixed_course:
                     # Double check the assignment - explicitly show what we're adding
-                    st.write(f"  ADDING: Name='{fixed_name}', Course='{fixed_course}', City='{city}'")
+                    debug_write(f"  ADDING: Name='{fixed_name}', Course='{fixed_course}', City='{city}'")
                     
                     tournament = {
                         "Date": date_value,
@@ -4403,7 +4408,7 @@ def parse_oga_format(text, default_year="2025", default_state=None):
                     }
                     
                     tournaments.append(tournament)
-                    st.write(f"✓ Added tournament: {fixed_name}")
+                    debug_write(f"✓ Added tournament: {fixed_name}")
                 
                 # Move to the next block (skip 5 lines)
                 i += 5
@@ -4411,7 +4416,7 @@ def parse_oga_format(text, default_year="2025", default_state=None):
                 # Not a recognizable block, move to next line
                 i += 1
         except Exception as e:
-            st.write(f"⚠ Error processing line {i+1}: {str(e)}")
+            debug_write(f"⚠ Error processing line {i+1}: {str(e)}")
             i += 1  # Move forward in case of error
     
     # Check the column assignments and fix if needed
@@ -4439,7 +4444,7 @@ def parse_oga_format(text, default_year="2025", default_state=None):
         
         # If there seems to be a swap (names have course keywords, courses have name keywords)
         if names_with_course_keywords > 0 and courses_with_name_keywords > 0:
-            st.write("WARNING: Possible column assignment issue detected. Checking tournament structure...")
+            debug_write("WARNING: Possible column assignment issue detected. Checking tournament structure...")
             
             # Let's verify by checking line structure
             # In this format, line 1 should be name, line 4 should be course-city
@@ -4458,7 +4463,7 @@ def parse_oga_format(text, default_year="2025", default_state=None):
                         # This confirms our format understanding
                         # Line 1 is the name (even if it contains "GC")
                         # Line 4 has "Course - City" format
-                        st.write("Confirmed format: Line 1 is name, Line 4 is 'Course - City'")
+                        debug_write("Confirmed format: Line 1 is name, Line 4 is 'Course - City'")
                         break
                 i += 1
     
@@ -4500,23 +4505,7 @@ def parse_day_month_tournament_format(text, year="2025", default_state=None):
     """
     # Process text into lines
     lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
-    lines = [line.strip() for line in lines if line.strip()]
-    
-    # Month mapping for date conversion
-    month_map = {
-        'Jan': '01', 'January': '01',
-        'Feb': '02', 'February': '02',
-        'Mar': '03', 'March': '03',
-        'Apr': '04', 'April': '04',
-        'May': '05', 
-        'Jun': '06', 'June': '06',
-        'Jul': '07', 'July': '07',
-        'Aug': '08', 'August': '08',
-        'Sep': '09', 'September': '09',
-        'Oct': '10', 'October': '10',
-        'Nov': '11', 'November': '11',
-        'Dec': '12', 'December': '12'
-    }
+    lines = [stripped for line in lines if (stripped := line.strip())]
     
     # List to store parsed tournaments
     tournaments = []
@@ -4530,8 +4519,8 @@ def parse_day_month_tournament_format(text, year="2025", default_state=None):
             day = lines[i].zfill(2)  # Pad with leading zero if needed
             
             # Check if next line is a month
-            if i+1 < len(lines) and lines[i+1] in month_map:
-                month = month_map[lines[i+1]]
+            if i+1 < len(lines) and lines[i+1] in MONTH_NUMBERS:
+                month = MONTH_NUMBERS[lines[i+1]]
                 
                 # Check for tournament name and course
                 if i+3 < len(lines):
@@ -4546,7 +4535,7 @@ def parse_day_month_tournament_format(text, year="2025", default_state=None):
                     # Create date string
                     date_value = f"{year}-{month}-{day}"
                     
-                    st.write(f"Found tournament: Day {day}, Month {month}, Name: {tournament_name}")
+                    debug_write(f"Found tournament: Day {day}, Month {month}, Name: {tournament_name}")
                     
                     # Determine category and gender
                     name_lower = tournament_name.lower()
@@ -4592,7 +4581,7 @@ def parse_day_month_tournament_format(text, year="2025", default_state=None):
                     }
                     
                     tournaments.append(tournament)
-                    st.write(f"✓ Added tournament: {tournament_name} at {course_name} on {date_value}")
+                    debug_write(f"✓ Added tournament: {tournament_name} at {course_name} on {date_value}")
                     
                     # Move to next potential tournament
                     i = next_i
@@ -4623,14 +4612,7 @@ def parse_nnga_data(text_input, default_year="2025", default_state=None):
     """
     # Process input text
     lines = text_input.replace('\r\n', '\n').replace('\r', '\n').split('\n')
-    lines = [line.strip() for line in lines if line.strip()]
-    
-    # Define month mapping
-    month_map = {
-        'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04', 
-        'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
-        'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-    }
+    lines = [stripped for line in lines if (stripped := line.strip())]
     
     # Initialize result list
     tournaments = []
@@ -4665,16 +4647,16 @@ def parse_nnga_data(text_input, default_year="2025", default_state=None):
                     if "-" in date_line:
                         # Get first date from range
                         first_part = date_line.split("-")[0].strip()
-                        date_match = re.search(r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})', first_part)
+                        date_match = WEEKDAY_MONTH_DAY_RE.search(first_part)
                         if date_match:
                             month, day = date_match.groups()
-                            date_value = f"{default_year}-{month_map[month]}-{day.zfill(2)}"
+                            date_value = f"{default_year}-{MONTH_NUMBERS[month]}-{day.zfill(2)}"
                     else:
                         # Single date
-                        date_match = re.search(r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})', date_line)
+                        date_match = WEEKDAY_MONTH_DAY_RE.search(date_line)
                         if date_match:
                             month, day = date_match.groups()
-                            date_value = f"{default_year}-{month_map[month]}-{day.zfill(2)}"
+                            date_value = f"{default_year}-{MONTH_NUMBERS[month]}-{day.zfill(2)}"
                     
                     # Only add if we have all required data
                     if date_value:
@@ -4786,29 +4768,13 @@ def simple_logical_parser(text, default_year="2025", default_state=None):
     import re
     import pandas as pd
     
-    # Month mapping
-    month_map = {
-        'Jan': '01', 'January': '01',
-        'Feb': '02', 'February': '02',
-        'Mar': '03', 'March': '03',
-        'Apr': '04', 'April': '04',
-        'May': '05',
-        'Jun': '06', 'June': '06',
-        'Jul': '07', 'July': '07',
-        'Aug': '08', 'August': '08',
-        'Sep': '09', 'Sept': '09', 'September': '09',
-        'Oct': '10', 'October': '10',
-        'Nov': '11', 'November': '11',
-        'Dec': '12', 'December': '12'
-    }
-    
     # Prepare lines and remove empty ones
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines = [stripped for line in text.split('\n') if (stripped := line.strip())]
     
     # Print the first 15 lines to debug
-    st.write("First 15 lines for debugging:")
+    debug_write("First 15 lines for debugging:")
     for i in range(min(15, len(lines))):
-        st.write(f"Line {i+1}: {lines[i]}")
+        debug_write(f"Line {i+1}: {lines[i]}")
     
     # Create result list
     tournaments = []
@@ -4826,13 +4792,13 @@ def simple_logical_parser(text, default_year="2025", default_state=None):
                 break
                 
             # Check if line i+3 looks like a location (City, ST)
-            location_match = re.search(r'(.*?),\s+([A-Z]{2})$', lines[i+3])
+            location_match = CITY_STATE_END_RE.search(lines[i+3])
             if location_match:
                 is_location_line = True
             
             # Check if line i+4 (if it exists) looks like a date
             if i + 4 < len(lines):
-                date_match = re.search(r'([A-Za-z]+)\s+\d{1,2}', lines[i+4])
+                date_match = MONTH_WORD_DAY_RE.search(lines[i+4])
                 if date_match:
                     is_date_line = True
             
@@ -4845,7 +4811,7 @@ def simple_logical_parser(text, default_year="2025", default_state=None):
                 date_line = lines[i+4]
                 
                 # Extract city and state from location line
-                location_match = re.search(r'(.*?),\s+([A-Z]{2})$', location_line)
+                location_match = CITY_STATE_END_RE.search(location_line)
                 city = None
                 state = default_state
                 
@@ -4855,7 +4821,7 @@ def simple_logical_parser(text, default_year="2025", default_state=None):
                 
                 # Extract date
                 date_value = None
-                date_match = re.search(r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})', date_line)
+                date_match = MONTH_DAY_YEAR_RE.search(date_line)
                 
                 if date_match:
                     month_name = date_match.group(1)
@@ -4863,20 +4829,20 @@ def simple_logical_parser(text, default_year="2025", default_state=None):
                     year = date_match.group(3)
                     
                     # Convert month name to number
-                    month = month_map.get(month_name[:3], '01')
+                    month = MONTH_NUMBERS.get(month_name[:3], '01')
                     
                     # Format date
                     date_value = f"{year}-{month}-{day.zfill(2)}"
                 else:
                     # Try date range format
-                    range_match = re.search(r'([A-Za-z]+)\s+(\d{1,2})\s*-\s*(?:[A-Za-z]+\s+)?(?:\d{1,2})?,\s*(\d{4})', date_line)
+                    range_match = MONTH_DAY_RANGE_YEAR_RE.search(date_line)
                     if range_match:
                         month_name = range_match.group(1)
                         day = range_match.group(2)
                         year = range_match.group(3)
                         
                         # Convert month name to number
-                        month = month_map.get(month_name[:3], '01')
+                        month = MONTH_NUMBERS.get(month_name[:3], '01')
                         
                         # Format date
                         date_value = f"{year}-{month}-{day.zfill(2)}"
@@ -4943,7 +4909,7 @@ def simple_logical_parser(text, default_year="2025", default_state=None):
                     
                     # Add to results
                     tournaments.append(tournament)
-                    st.write(f"✓ Added tournament: {tournament_line}")
+                    debug_write(f"✓ Added tournament: {tournament_line}")
                 
                 # Move to next block - skip 5 lines
                 i += 5
@@ -4951,7 +4917,7 @@ def simple_logical_parser(text, default_year="2025", default_state=None):
                 # No valid block found, move forward by 1
                 i += 1
         except Exception as e:
-            st.write(f"⚠ Error processing block at line {i+1}: {str(e)}")
+            debug_write(f"⚠ Error processing block at line {i+1}: {str(e)}")
             # Move forward by 1 in case of error
             i += 1
     
@@ -4962,10 +4928,10 @@ def simple_logical_parser(text, default_year="2025", default_state=None):
         while i + 3 < len(lines):
             try:
                 # Check if line i+2 looks like a location line
-                location_match = re.search(r'(.*?),\s+([A-Z]{2})$', lines[i+2])
+                location_match = CITY_STATE_END_RE.search(lines[i+2])
                 
                 # Check if line i+3 looks like a date line
-                date_match = re.search(r'([A-Za-z]+)\s+\d{1,2}', lines[i+3])
+                date_match = MONTH_WORD_DAY_RE.search(lines[i+3])
                 
                 if location_match and date_match:
                     # This is a valid 4-line block
@@ -4981,21 +4947,21 @@ def simple_logical_parser(text, default_year="2025", default_state=None):
                     
                     # Extract date
                     date_value = None
-                    date_full_match = re.search(r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})', date_line)
+                    date_full_match = MONTH_DAY_YEAR_RE.search(date_line)
                     if date_full_match:
                         month_name = date_full_match.group(1)
                         day = date_full_match.group(2)
                         year = date_full_match.group(3)
-                        month = month_map.get(month_name[:3], '01')
+                        month = MONTH_NUMBERS.get(month_name[:3], '01')
                         date_value = f"{year}-{month}-{day.zfill(2)}"
                     else:
                         # Try date range
-                        range_match = re.search(r'([A-Za-z]+)\s+(\d{1,2})\s*-\s*(?:[A-Za-z]+\s+)?(?:\d{1,2})?,\s*(\d{4})', date_line)
+                        range_match = MONTH_DAY_RANGE_YEAR_RE.search(date_line)
                         if range_match:
                             month_name = range_match.group(1)
                             day = range_match.group(2)
                             year = range_match.group(3)
-                            month = month_map.get(month_name[:3], '01')
+                            month = MONTH_NUMBERS.get(month_name[:3], '01')
                             date_value = f"{year}-{month}-{day.zfill(2)}"
                     
                     if date_value:
@@ -5021,12 +4987,12 @@ def simple_logical_parser(text, default_year="2025", default_state=None):
                         }
                         
                         tournaments.append(tournament)
-                        st.write(f"✓ Added tournament (4-line): {tournament_line}")
+                        debug_write(f"✓ Added tournament (4-line): {tournament_line}")
                 
                 # Move forward by 4 lines
                 i += 4
             except Exception as e:
-                st.write(f"⚠ Error processing 4-line block at line {i+1}: {str(e)}")
+                debug_write(f"⚠ Error processing 4-line block at line {i+1}: {str(e)}")
                 i += 1
     
     # Convert to DataFrame - with specific column ordering
@@ -5080,110 +5046,160 @@ output_filename = st.text_input(
     key="output_filename_input"  # Added unique key
 )
 
+# Per-line parser debug output (off by default to keep reruns fast)
+show_parsing_details = st.checkbox(
+    "Show parsing details",
+    value=False,
+    key="show_parsing_details_input"
+)
+
 def ensure_column_order(df):
     """Ensure DataFrame columns are in the correct order."""
     # Get all columns that exist in the DataFrame
     existing_columns = [col for col in REQUIRED_COLUMNS if col in df.columns]
     
-    # Add any additional columns that might exist
-    other_columns = [col for col in df.columns if col not in REQUIRED_COLUMNS]
+    # Add any additional columns that might exist (set lookup instead of scanning the list)
+    required_set = set(REQUIRED_COLUMNS)
+    other_columns = [col for col in df.columns if col not in required_set]
+    
+    # Reorder columns, skipping the reorder entirely when the order is already right
+    ordered_columns = existing_columns + other_columns
+    if list(df.columns) == ordered_columns:
+        return df
+    return df[ordered_columns]
+
+@st.cache_data
+def convert_df_to_csv(df):
+    """Serialize the DataFrame to CSV bytes for download, cached on the DataFrame content."""
+    # Write straight into a bytes buffer so the download gets encoded bytes without an extra str copy
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, encoding='utf-8')
+    return buffer.getvalue()
+
+@st.cache_data
+def convert_df_to_excel(df):
+    """Serialize the DataFrame to Excel bytes for download, cached on the DataFrame content."""
+    # strings_to_urls=False skips the per-cell URL check (tournament data has no links)
+    buffer = io.BytesIO()
+    writer_options = {'strings_to_urls': False}
+    with pd.ExcelWriter(buffer, engine='xlsxwriter', engine_kwargs={'options': writer_options}) as writer:
+        df.to_excel(writer, sheet_name='Tournaments', index=False)
+        
+        # Auto-adjust columns' width from a single string cast of the frame
+        worksheet = writer.sheets['Tournaments']
+        str_df = df.astype(str)
+        for i, col in enumerate(df.columns):
+            longest_value = str_df[col].str.len().max()
+            max_len = max(int(0 if pd.isna(longest_value) else longest_value), len(col)) + 2
+            worksheet.set_column(i, i, max_len)
+    
+    return buffer.getvalue()
+
+@st.cache_data
+def detect_and_parse_tournaments(tournament_text, year, default_state, show_details=False):
+    """
+    Pick the parser that matches the pasted text and run it.
+    Cached on the text and settings so reruns with unchanged input skip parsing;
+    show_details is part of the key because it changes the debug output.
+    """
+    global parse_details_enabled
+    parse_details_enabled = show_details
+    
+    # Split the raw text once and reuse it for every detection check below
+    raw_lines = tournament_text.split('\n')
     
-    # Reorder columns
-    return df[existing_columns + other_columns]
+    # First, try to detect specific formats that have clear signatures
+    
+    # Check for Golf Tournament Series format (pattern with $ and registration/date)
+    if any(line.strip().startswith("$") for line in raw_lines) and ("Register" in tournament_text):
+        st.write("Detected Golf Tournament Series format - using specialized parser")
+        df = parse_golf_tournament_series_format(tournament_text, year, default_state)
+        
+    # Check for VSGA format (Virginia State Golf Association)
+    elif "VSGA" in tournament_text or (re.search(r'\d{4}\s+VSGA', tournament_text) and ", VA" in tournament_text):
+        st.write("Detected VSGA format - using specialized parser")
+        df = parse_vsga_format(tournament_text, year, default_state)
+        
+    # Check for OGA format with "Event Website" pattern
+    elif "Event Website" in tournament_text:
+        st.write("Detected OGA format - using specialized parser")
+        df = parse_oga_format(tournament_text, year, default_state)
+    
+    # Check for Golf Association format with Logo and "Association" patterns
+    elif "Logo" in tournament_text and "Association" in tournament_text:
+        st.write("Detected Golf Association format - using specialized parser")
+        df = parse_golf_association_format(tournament_text, year, default_state)
+    
+    # Try to detect Golf Genius format
+    elif "View" in tournament_text and ("OPEN" in tournament_text or "OPENS" in tournament_text or "closes on" in tournament_text):
+        st.write("Detected Golf Genius format - using specialized parser")
+        df = parse_golf_genius_format(tournament_text, year, default_state)
+    
+    # Try simple logical parser for the specific 5-line format
+    elif len(raw_lines) % 5 == 0 or len(raw_lines) % 5 < 3:
+        st.write("Trying simple logical parser...")
+        df = simple_logical_parser(tournament_text, year, default_state)
+        
+        if not df.empty:
+            st.write(f"Successfully parsed {len(df)} tournaments using simple logical parser")
+        else:
+            # If simple parser fails, fall back to other parsers
+            if "View" in tournament_text:
+                st.write("Detected NNGA format - using specialized parser")
+                # Use whichever NNGA parser function exists in your code
+                if 'parse_usga_qualifier_format' in globals():
+                    df = parse_usga_qualifier_format(tournament_text)
+                elif 'parse_usga_view_format' in globals():
+                    df = parse_usga_view_format(tournament_text)
+                else:
+                    # Fallback to standard parsing
+                    st.write("No specialized NNGA parser found, using standard format detection")
+                    df = parse_tournament_text(tournament_text)
+            else:
+                # Try the improved unified Amateur Golf format parser
+                df = parse_amateur_golf_format_improved(tournament_text, year, default_state)
+                
+                if not df.empty:
+                    st.write(f"Successfully parsed {len(df)} tournaments using improved Amateur Golf format parser")
+                else:
+                    # Fall back to standard format detection
+                    st.write("Using standard format detection")
+                    df = parse_tournament_text(tournament_text)
+    else:
+        # For other formats, try the standard format detection first
+        st.write("Using standard format detection")
+        df = parse_tournament_text(tournament_text)
+        
+        # If standard detection fails, try specialized parsers
+        if df.empty:
+            # Check for monthly entries format with month headers
+            if any(marker in tournament_text for marker in ENTRY_STATUS_MARKERS):
+                st.write("Detected Monthly-Entries format - using specialized parser")
+                df = parse_monthly_entries_format(tournament_text, year, default_state)
+            
+            # Check for day-month-tournament pattern
+            elif any(line.isdigit() and 1 <= int(line) <= 31 for line in raw_lines):
+                # Strip lines and filter out empty ones
+                lines = [stripped for line in raw_lines if (stripped := line.strip())]
+                
+                # Count pattern occurrences: day number followed by month name
+                pattern_count = 0
+                for i in range(len(lines) - 1):
+                    if (lines[i].isdigit() and 1 <= int(lines[i]) <= 31 and 
+                        i+1 < len(lines) and lines[i+1] in MONTH_NAME_SET):
+                        pattern_count += 1
+                
+                if pattern_count >= 2:
+                    st.write("Detected Day-Month-Tournament format - using specialized parser")
+                    df = parse_day_month_tournament_format(tournament_text, year, default_state)
+    
+    return df
 
 # Process button
 if st.button("Process Tournament Data"):
     if tournament_text:
         try:
-            # First, try to detect specific formats that have clear signatures
-            
-            # Check for Golf Tournament Series format (pattern with $ and registration/date)
-            if any(line.strip().startswith("$") for line in tournament_text.split('\n')) and ("Register" in tournament_text):
-                st.write("Detected Golf Tournament Series format - using specialized parser")
-                df = parse_golf_tournament_series_format(tournament_text, year, default_state)
-                
-            # Check for VSGA format (Virginia State Golf Association)
-            elif "VSGA" in tournament_text or (re.search(r'\d{4}\s+VSGA', tournament_text) and ", VA" in tournament_text):
-                st.write("Detected VSGA format - using specialized parser")
-                df = parse_vsga_format(tournament_text, year, default_state)
-                
-            # Check for OGA format with "Event Website" pattern
-            elif "Event Website" in tournament_text:
-                st.write("Detected OGA format - using specialized parser")
-                df = parse_oga_format(tournament_text, year, default_state)
-            
-            # Check for Golf Association format with Logo and "Association" patterns
-            elif "Logo" in tournament_text and "Association" in tournament_text:
-                st.write("Detected Golf Association format - using specialized parser")
-                df = parse_golf_association_format(tournament_text, year, default_state)
-            
-            # Try to detect Golf Genius format
-            elif "View" in tournament_text and ("OPEN" in tournament_text or "OPENS" in tournament_text or "closes on" in tournament_text):
-                st.write("Detected Golf Genius format - using specialized parser")
-                df = parse_golf_genius_format(tournament_text, year, default_state)
-            
-            # Try simple logical parser for the specific 5-line format
-            elif len(tournament_text.split('\n')) % 5 == 0 or len(tournament_text.split('\n')) % 5 < 3:
-                st.write("Trying simple logical parser...")
-                df = simple_logical_parser(tournament_text, year, default_state)
-                
-                if not df.empty:
-                    st.write(f"Successfully parsed {len(df)} tournaments using simple logical parser")
-                else:
-                    # If simple parser fails, fall back to other parsers
-                    if "View" in tournament_text:
-                        st.write("Detected NNGA format - using specialized parser")
-                        # Use whichever NNGA parser function exists in your code
-                        if 'parse_usga_qualifier_format' in globals():
-                            df = parse_usga_qualifier_format(tournament_text)
-                        elif 'parse_usga_view_format' in globals():
-                            df = parse_usga_view_format(tournament_text)
-                        else:
-                            # Fallback to standard parsing
-                            st.write("No specialized NNGA parser found, using standard format detection")
-                            df = parse_tournament_text(tournament_text)
-                    else:
-                        # Try the improved unified Amateur Golf format parser
-                        df = parse_amateur_golf_format_improved(tournament_text, year, default_state)
-                        
-                        if not df.empty:
-                            st.write(f"Successfully parsed {len(df)} tournaments using improved Amateur Golf format parser")
-                        else:
-                            # Fall back to standard format detection
-                            st.write("Using standard format detection")
-                            df = parse_tournament_text(tournament_text)
-            else:
-                # For other formats, try the standard format detection first
-                st.write("Using standard format detection")
-                df = parse_tournament_text(tournament_text)
-                
-                # If standard detection fails, try specialized parsers
-                if df.empty:
-                    # Check for monthly entries format with month headers
-                    if re.search(r'Entry Deadline:|Entries Closed|Entries Open:', tournament_text):
-                        st.write("Detected Monthly-Entries format - using specialized parser")
-                        df = parse_monthly_entries_format(tournament_text, year, default_state)
-                    
-                    # Check for day-month-tournament pattern
-                    elif any(line.isdigit() and 1 <= int(line) <= 31 for line in tournament_text.split('\n')):
-                        # Split into lines and filter out empty ones
-                        lines = [line.strip() for line in tournament_text.split('\n') if line.strip()]
-                        
-                        # Count pattern occurrences: day number followed by month name
-                        month_names = ['Jan', 'January', 'Feb', 'February', 'Mar', 'March', 
-                                     'Apr', 'April', 'May', 'Jun', 'June', 'Jul', 'July', 
-                                     'Aug', 'August', 'Sep', 'September', 'Oct', 'October',
-                                     'Nov', 'November', 'Dec', 'December']
-                        
-                        pattern_count = 0
-                        for i in range(len(lines) - 1):
-                            if (lines[i].isdigit() and 1 <= int(lines[i]) <= 31 and 
-                                i+1 < len(lines) and lines[i+1] in month_names):
-                                pattern_count += 1
-                        
-                        if pattern_count >= 2:
-                            st.write("Detected Day-Month-Tournament format - using specialized parser")
-                            df = parse_day_month_tournament_format(tournament_text, year, default_state)
+            df = detect_and_parse_tournaments(tournament_text, year, default_state, show_parsing_details)
             
             # Check if DataFrame is empty
             if df.empty:
@@ -5193,7 +5209,7 @@ if st.button("Process Tournament Data"):
             else:
                 # Show detailed information about the parsed data
                 st.write("### Parsed Tournament Data (First few rows)")
-                display_df = df.head(5).copy()
+                display_df = df.head(5)
                 # Convert any complex objects to strings for display
                 for col in display_df.columns:
                     display_df[col] = display_df[col].apply(lambda x: str(x) if x is not None else None)
@@ -5211,9 +5227,15 @@ if st.button("Process Tournament Data"):
                         st.warning(f"Found {empty_names.sum()} entries with missing names but valid courses. Using course names as tournament names.")
                         df.loc[empty_names, 'Name'] = df.loc[empty_names, 'Course'] + " Tournament"
                 
-                # Ensure Gender is set for all rows
+                # Ensure Gender is set for all rows (vectorized equivalent of determine_gender)
                 if 'Name' in df.columns and 'Gender' in df.columns:
-                    df['Gender'] = df.apply(lambda row: row['Gender'] if pd.notna(row['Gender']) else determine_gender(row['Name']), axis=1)
+                    missing_gender = df['Gender'].isna()
+                    if missing_gender.any():
+                        names = df.loc[missing_gender, 'Name'].fillna('').str.lower()
+                        is_womens = names.str.contains(WOMEN_KEYWORDS_RE, na=False).to_numpy(dtype=bool)
+                        # Gender may be an all-missing float column; make it object before writing strings
+                        df['Gender'] = df['Gender'].astype(object)
+                        df.loc[missing_gender, 'Gender'] = np.where(is_womens, "Women's", "Men's")
                 
                 # Ensure columns are in the correct order
                 if 'Format' in df.columns:
@@ -5229,8 +5251,9 @@ if st.button("Process Tournament Data"):
                             df[col] = None
                     
                     # Set column order
+                    custom_set = set(custom_columns)
                     column_order = [col for col in custom_columns if col in df.columns]
-                    extra_columns = [col for col in df.columns if col not in custom_columns]
+                    extra_columns = [col for col in df.columns if col not in custom_set]
                     df = df[column_order + extra_columns]
                 else:
                     # Use standard column order
@@ -5263,7 +5286,7 @@ if st.button("Process Tournament Data"):
                 st.dataframe(df.head(max_rows), height=500)
             
             # Create download buttons for the data
-            csv = df.to_csv(index=False)
+            csv = convert_df_to_csv(df)
             st.download_button(
                 label="Download CSV",
                 data=csv,
@@ -5272,29 +5295,19 @@ if st.button("Process Tournament Data"):
             )
             
             # Excel download
-            buffer = io.BytesIO()
-            with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
-                df.to_excel(writer, sheet_name='Tournaments', index=False)
-                
-                # Auto-adjust columns' width
-                worksheet = writer.sheets['Tournaments']
-                for i, col in enumerate(df.columns):
-                    max_len = max(df[col].astype(str).apply(len).max(), len(col)) + 2
-                    worksheet.set_column(i, i, max_len)
-            
-            buffer.seek(0)
+            excel_data = convert_df_to_excel(df)
             
             st.download_button(
                 label="Download Excel",
-                data=buffer,
+                data=excel_data,
                 file_name=f"{output_filename}.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
             )
             
         except Exception as e:
             st.error(f"Error processing text: {str(e)}")
-            # Show traceback for debugging
-            import traceback
-            st.code(traceback.format_exc())
+            # Show traceback for debugging only when parsing details are requested
+            if show_parsing_details:
+                st.code(traceback.format_exc())
     else:
         st.error("Please enter tournament text data.")
\ No newline at end of file